@@ -10,17 +10,38 @@ References:
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 import numpy as np
-from scipy.integrate import fixed_quad
 
 from acoustic.utils import Z_0
 
 
+@lru_cache(maxsize=32)
+def _paris_quadrature(n_points: int, theta_max_deg: float) -> tuple[np.ndarray, np.ndarray]:
+    """Gauss-Legendre nodes on [0, theta_max] as (cos(theta), w*sin(theta)*cos(theta)).
+
+    Cached per (n_points, theta_max_deg); the returned arrays are read-only.
+    """
+    theta_max_rad = np.radians(theta_max_deg)
+    nodes, weights = np.polynomial.legendre.leggauss(n_points)
+    # Map from [-1, 1] to [0, theta_max_rad]
+    thetas = 0.5 * theta_max_rad * (nodes + 1.0)
+    w = 0.5 * theta_max_rad * weights
+
+    cos_t = np.cos(thetas)
+    paris_w = w * np.sin(thetas) * cos_t
+    cos_t.flags.writeable = False
+    paris_w.flags.writeable = False
+    return cos_t, paris_w
+
+
 def diffuse_field_alpha_from_impedance(
     Zs: np.ndarray,
     n_points: int = 10,
     theta_max_deg: float = 78.0,
     z0: float = Z_0,
+    dtype: np.dtype | type = np.float64,
 ) -> np.ndarray:
     """Compute diffuse-field absorption using the locally-reacting surface approximation.
 
@@ -34,37 +55,52 @@ def diffuse_field_alpha_from_impedance(
         alpha_diff = 2 * integral_0^theta_max [ alpha(theta) * sin(theta) * cos(theta) ] dtheta
 
     Args:
-        Zs: Complex surface impedance array, shape (N,).
+        Zs: Complex surface impedance array, shape (N,), or (..., N) to
+            integrate several designs in one call.
         n_points: Number of Gaussian quadrature points (default: 10).
         theta_max_deg: Maximum integration angle in degrees (default: 78°).
         z0: Characteristic impedance of air.
+        dtype: Real dtype for the integration and the result. np.float32 halves
+            memory traffic and is ample for an absorption coefficient.
 
     Returns:
-        Diffuse-field absorption coefficient array, shape (N,).
+        Diffuse-field absorption coefficient array with the shape of Zs, of ``dtype``.
     """
-    theta_max_rad = np.radians(theta_max_deg)
-    N = len(Zs)
-
-    # Evaluate integrand at all quadrature points at once for efficiency.
-    # We use explicit Gauss-Legendre quadrature to avoid scipy's fixed_quad
-    # broadcast issues.
-    nodes, weights = np.polynomial.legendre.leggauss(n_points)
-    # Map from [-1, 1] to [0, theta_max_rad]
-    thetas = 0.5 * theta_max_rad * (nodes + 1.0)
-    w = 0.5 * theta_max_rad * weights
-
-    result = np.zeros(N)
-    for j in range(n_points):
-        theta = thetas[j]
-        cos_theta = np.cos(theta)
-        sin_theta = np.sin(theta)
-
-        # Locally-reacting: R depends on angle via cos(theta) factor
-        R = (Zs * cos_theta - z0) / (Zs * cos_theta + z0)
-        alpha_theta = np.clip(1.0 - np.abs(R) ** 2, 0.0, 1.0)
-
-        result += w[j] * alpha_theta * sin_theta * cos_theta
-
-    # Paris formula factor of 2
-    alpha_diff = 2.0 * np.real(result)
-    return np.clip(alpha_diff, 0.0, 1.0)
+    Zs = np.asarray(Zs)
+    dtype = np.dtype(dtype)
+
+    cos_t, paris_w = _paris_quadrature(int(n_points), float(theta_max_deg))
+    cos_t = cos_t.astype(dtype, copy=False)
+    paris_w = paris_w.astype(dtype, copy=False)
+    z0 = dtype.type(z0)
+
+    # Broadcast over (..., frequency, angle): one vectorized pass instead of a
+    # Python loop over quadrature points. Angles sit on the last axis so the
+    # weighted sum is a contiguous matrix-vector product for any batch shape.
+    #
+    # Locally-reacting: R depends on angle via cos(theta) factor. With
+    # Z = Zs*cos(theta) = a + jb, the identity |Z + Z0|^2 - |Z - Z0|^2 = 4*Z0*a
+    # gives 1 - |R|^2 = 4*Z0*a / ((a + Z0)^2 + b^2), so the whole integrand
+    # stays in real arithmetic with no complex division.
+    #
+    # A rigid-wall Zs (~1e30) overflows the squares in float32; the ratio
+    # still goes to the correct limit of zero.
+    a = np.multiply.outer(Zs.real.astype(dtype, copy=False), cos_t)
+    b = np.multiply.outer(Zs.imag.astype(dtype, copy=False), cos_t)
+    denom = a + z0
+    with np.errstate(over="ignore"):
+        denom *= denom
+        b *= b
+    denom += b
+    a *= 4.0 * z0
+    # The ratio is <= 1 by construction ((a - Z0)^2 + b^2 >= 0), so only the
+    # lower bound needs enforcing (non-passive Re(Zs) < 0).
+    alpha_theta = np.divide(a, denom, out=a)
+    np.maximum(alpha_theta, 0.0, out=alpha_theta)
+
+    result = alpha_theta @ paris_w
+
+    # Paris formula factor of 2. The weights integrate to sin^2(theta_max) <= 1,
+    # so the upper bound holds automatically.
+    alpha_diff = 2.0 * result
+    return np.maximum(alpha_diff, 0.0)
@@ -10,14 +10,15 @@ from __future__ import annotations
 
 import numpy as np
 
-from acoustic.utils import C_0, Z_0
+from acoustic.utils import C_0, Z_0, FreqCache
 
 
 def air_gap_matrix(
     freqs: np.ndarray,
-    thickness_m: float,
+    thickness_m: float | np.ndarray,
     c0: float = C_0,
     z0: float = Z_0,
+    ctx: FreqCache | None = None,
 ) -> np.ndarray:
     """Transfer matrix for a lossless air gap.
 
@@ -26,22 +27,30 @@ def air_gap_matrix(
 
     Args:
         freqs: Frequency array (Hz), shape (N,).
-        thickness_m: Air gap thickness in metres.
+        thickness_m: Air gap thickness in metres. An array of shape (M,)
+            evaluates M designs at once.
         c0: Speed of sound (m/s).
         z0: Characteristic impedance of air (Pa·s/m).
+        ctx: Optional shared frequency cache for the same freqs (see utils.FreqCache).
 
     Returns:
-        Transfer matrix array, shape (N, 2, 2), complex.
+        Transfer matrix array, shape (N, 2, 2), or (M, N, 2, 2) for an array
+        of thicknesses, complex.
     """
-    k0 = 2.0 * np.pi * freqs / c0
-    kd = k0 * thickness_m
-    cos_kd = np.cos(kd)
-    sin_kd = np.sin(kd)
-
-    N = len(freqs)
-    T = np.zeros((N, 2, 2), dtype=complex)
-    T[:, 0, 0] = cos_kd
-    T[:, 0, 1] = 1j * z0 * sin_kd
-    T[:, 1, 0] = 1j * sin_kd / z0
-    T[:, 1, 1] = cos_kd
+    if ctx is None:
+        ctx = FreqCache(freqs)
+    k0 = ctx.k0 if c0 == C_0 else ctx.omega / c0
+    kd = np.expand_dims(thickness_m, -1) * k0
+
+    # Evaluate cos/sin straight into the real and imaginary views of the
+    # output; the off-diagonal real parts and diagonal imaginary parts are
+    # identically zero, so no complex temporaries are needed.
+    T = np.zeros(kd.shape + (2, 2), dtype=complex)
+    T_re = T.real
+    T_im = T.imag
+    np.cos(kd, out=T_re[..., 0, 0])
+    T_re[..., 1, 1] = T_re[..., 0, 0]
+    np.sin(kd, out=T_im[..., 0, 1])
+    np.multiply(T_im[..., 0, 1], 1.0 / z0, out=T_im[..., 1, 0])
+    T_im[..., 0, 1] *= z0
     return T
@@ -12,7 +12,7 @@ from __future__ import annotations
 
 import numpy as np
 
-from acoustic.utils import C_0, ETA, RHO_0
+from acoustic.utils import C_0, ETA, RHO_0, FreqCache, viscous_boundary_layer
 
 
 def helmholtz_resonance(
@@ -36,13 +36,55 @@ def helmholtz_resonance(
     Returns:
         Resonance frequency in Hz.
     """
-    A_neck = np.pi * neck_radius_m**2
+    A_neck = np.pi * neck_radius_m * neck_radius_m
     # Ingard end correction: flanged opening on both ends of neck
     delta = 0.85 * 2.0 * neck_radius_m
     L_eff = neck_length_m + delta
 
-    f0 = (c0 / (2.0 * np.pi)) * np.sqrt(A_neck / (cavity_volume_m3 * L_eff))
-    return float(f0)
+    return float((c0 / (2.0 * np.pi)) * np.sqrt(A_neck / (cavity_volume_m3 * L_eff)))
+
+
+def _helmholtz_terms(
+    freqs: np.ndarray,
+    neck_length_m: float,
+    neck_radius_m: float,
+    cavity_volume_m3: float,
+    viscous_loss: bool,
+    c0: float,
+    rho0: float,
+    ctx: FreqCache,
+) -> tuple[np.ndarray, np.ndarray | float]:
+    """Impedance Z(f) and neck resistance R_neck(f), sharing intermediates.
+
+    R_neck is the scalar 0.0 when viscous_loss is False.
+    """
+    omega = ctx.omega
+    r_sq = neck_radius_m * neck_radius_m
+    A_neck = np.pi * r_sq
+
+    # End correction
+    delta = 0.85 * 2.0 * neck_radius_m
+    L_eff = neck_length_m + delta
+
+    # Acoustic mass (neck inertance)
+    M_neck = rho0 * L_eff / A_neck
+
+    # Acoustic stiffness (cavity compliance)
+    K_cavity = rho0 * c0 * c0 / cavity_volume_m3
+
+    # Viscous resistance in the neck
+    if viscous_loss:
+        delta_v = ctx.delta_v if rho0 == RHO_0 else viscous_boundary_layer(omega, rho0)
+        R_neck = (8.0 * ETA * L_eff) / (np.pi * r_sq * r_sq) + (rho0 / A_neck) * omega * delta_v
+    else:
+        R_neck = 0.0
+
+    # Impedance: R + j*(omega*M - K/omega), written straight into the real
+    # and imaginary parts
+    Z = np.empty(omega.shape, dtype=complex)
+    Z.real = R_neck
+    Z.imag = omega * M_neck - K_cavity / omega
+    return Z, R_neck
 
 
 def helmholtz_impedance(
@@ -53,6 +95,7 @@ def helmholtz_impedance(
     viscous_loss: bool = True,
     c0: float = C_0,
     rho0: float = RHO_0,
+    ctx: FreqCache | None = None,
 ) -> np.ndarray:
     """Complex acoustic impedance of a Helmholtz resonator.
 
@@ -70,32 +113,15 @@ def helmholtz_impedance(
         viscous_loss: Include viscous neck losses (default: True).
         c0: Speed of sound (m/s).
         rho0: Air density (kg/m³).
+        ctx: Optional shared frequency cache for the same freqs (see utils.FreqCache).
 
     Returns:
         Complex impedance array Z(f), shape (N,).
     """
-    omega = 2.0 * np.pi * freqs
-    A_neck = np.pi * neck_radius_m**2
-
-    # End correction
-    delta = 0.85 * 2.0 * neck_radius_m
-    L_eff = neck_length_m + delta
-
-    # Acoustic mass (neck inertance)
-    M_neck = rho0 * L_eff / A_neck
-
-    # Acoustic stiffness (cavity compliance)
-    K_cavity = rho0 * c0**2 / cavity_volume_m3
-
-    # Viscous resistance in the neck
-    if viscous_loss:
-        delta_v = np.sqrt(2.0 * ETA / (rho0 * omega))
-        R_neck = (8.0 * ETA * L_eff) / (np.pi * neck_radius_m**4) + rho0 * omega * delta_v / A_neck
-    else:
-        R_neck = np.zeros_like(freqs)
-
-    # Impedance: R + j*(omega*M - K/omega)
-    Z = R_neck + 1j * (omega * M_neck - K_cavity / omega)
+    if ctx is None:
+        ctx = FreqCache(freqs)
+    Z, _ = _helmholtz_terms(freqs, neck_length_m, neck_radius_m, cavity_volume_m3,
+                            viscous_loss, c0, rho0, ctx)
     return Z
 
 
@@ -106,6 +132,7 @@ def helmholtz_absorption_area(
     cavity_volume_m3: float,
     c0: float = C_0,
     rho0: float = RHO_0,
+    ctx: FreqCache | None = None,
 ) -> np.ndarray:
     """Absorption cross-section (equivalent absorption area) of a Helmholtz resonator.
 
@@ -120,29 +147,27 @@ def helmholtz_absorption_area(
         cavity_volume_m3: Cavity volume (m³).
         c0: Speed of sound (m/s).
         rho0: Air density (kg/m³).
+        ctx: Optional shared frequency cache for the same freqs (see utils.FreqCache).
 
     Returns:
         Absorption area array A(f) in m², shape (N,).
     """
-    omega = 2.0 * np.pi * freqs
-    A_neck = np.pi * neck_radius_m**2
+    if ctx is None:
+        ctx = FreqCache(freqs)
+    omega = ctx.omega
     wavelength = c0 / freqs
 
-    Z = helmholtz_impedance(freqs, neck_length_m, neck_radius_m, cavity_volume_m3,
-                            viscous_loss=True, c0=c0, rho0=rho0)
+    # Impedance and viscous neck resistance from one evaluation
+    Z, R_neck = _helmholtz_terms(freqs, neck_length_m, neck_radius_m, cavity_volume_m3,
+                                 True, c0, rho0, ctx)
 
     # Radiation resistance (one side, flanged)
     k0 = omega / c0
-    R_rad = rho0 * c0 * (k0 * neck_radius_m)**2 / (2.0 * np.pi)
-
-    # Viscous neck resistance
-    delta = 0.85 * 2.0 * neck_radius_m
-    L_eff = neck_length_m + delta
-    delta_v = np.sqrt(2.0 * ETA / (rho0 * omega))
-    R_neck = (8.0 * ETA * L_eff) / (np.pi * neck_radius_m**4) + rho0 * omega * delta_v / A_neck
+    R_rad = (rho0 * c0 * neck_radius_m * neck_radius_m / (2.0 * np.pi)) * (k0 * k0)
 
     # Absorption cross-section
     Z0_acoustic = rho0 * c0
-    A = wavelength**2 / np.pi * R_rad * R_neck / np.abs(Z)**2
+    Z_mag2 = Z.real * Z.real + Z.imag * Z.imag
+    A = wavelength * wavelength / np.pi * R_rad * R_neck / Z_mag2
 
     return np.maximum(A, 0.0)
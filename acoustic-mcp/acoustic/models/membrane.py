@@ -12,12 +12,13 @@ from __future__ import annotations
 
 import numpy as np
 
-from acoustic.utils import C_0, RHO_0
+from acoustic.utils import C_0, RHO_0, FreqCache
 
 
 def membrane_matrix(
     freqs: np.ndarray,
-    mass_per_area: float,
+    mass_per_area: float | np.ndarray,
+    ctx: FreqCache | None = None,
 ) -> np.ndarray:
     """Transfer matrix for a limp membrane (mass-law layer).
 
@@ -26,29 +27,32 @@ def membrane_matrix(
 
     Args:
         freqs: Frequency array (Hz), shape (N,).
-        mass_per_area: Surface mass density (kg/m²).
+        mass_per_area: Surface mass density (kg/m²). An array of shape (M,)
+            evaluates M designs at once.
+        ctx: Optional shared frequency cache for the same freqs (see utils.FreqCache).
 
     Returns:
-        Transfer matrix array, shape (N, 2, 2), complex.
+        Transfer matrix array, shape (N, 2, 2), or (M, N, 2, 2) for an array
+        of masses, complex.
     """
-    omega = 2.0 * np.pi * freqs
-    Z_mem = 1j * omega * mass_per_area
-
-    N = len(freqs)
-    T = np.zeros((N, 2, 2), dtype=complex)
-    T[:, 0, 0] = 1.0
-    T[:, 0, 1] = Z_mem
-    T[:, 1, 0] = 0.0
-    T[:, 1, 1] = 1.0
+    if ctx is None:
+        ctx = FreqCache(freqs)
+    Z_mem = 1j * np.expand_dims(mass_per_area, -1) * ctx.omega
+
+    T = np.empty(Z_mem.shape + (2, 2), dtype=complex)
+    T[..., 0, 0] = 1.0
+    T[..., 0, 1] = Z_mem
+    T[..., 1, 0] = 0.0
+    T[..., 1, 1] = 1.0
     return T
 
 
 def panel_absorber_resonance(
-    mass_per_area: float,
-    air_gap_m: float,
+    mass_per_area: float | np.ndarray,
+    air_gap_m: float | np.ndarray,
     c0: float = C_0,
     rho0: float = RHO_0,
-) -> float:
+) -> float | np.ndarray:
     """Resonance frequency of a panel absorber (membrane + air gap).
 
     f_0 = (c_0 / (2*pi)) * sqrt(rho_0 / (m * d))
@@ -56,12 +60,13 @@ def panel_absorber_resonance(
     where m is surface mass density and d is air gap depth.
 
     Args:
-        mass_per_area: Surface mass density (kg/m²).
+        mass_per_area: Surface mass density (kg/m²). Arrays broadcast
+            against air_gap_m.
         air_gap_m: Air gap depth behind panel (m).
         c0: Speed of sound (m/s).
         rho0: Air density (kg/m³).
 
     Returns:
-        Resonance frequency in Hz.
+        Resonance frequency in Hz, with the broadcast shape of the inputs.
     """
     return (c0 / (2.0 * np.pi)) * np.sqrt(rho0 / (mass_per_area * air_gap_m))
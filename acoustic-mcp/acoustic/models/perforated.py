@@ -12,9 +12,11 @@ References:
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 import numpy as np
 
-from acoustic.utils import C_0, ETA, RHO_0, Z_0
+from acoustic.utils import C_0, ETA, RHO_0, Z_0, FreqCache
 
 
 def _perforate_porosity(hole_diameter_m: float, spacing_m: float) -> float:
@@ -26,15 +28,42 @@ def _perforate_porosity(hole_diameter_m: float, spacing_m: float) -> float:
             f"hole_diameter ({hole_diameter_m * 1000:.1f} mm) must be less than "
             f"hole_spacing ({spacing_m * 1000:.1f} mm)"
         )
-    epsilon = np.pi * (hole_diameter_m / 2) ** 2 / spacing_m**2
+    r = hole_diameter_m / 2
+    epsilon = np.pi * r * r / (spacing_m * spacing_m)
     return epsilon
 
 
+@lru_cache(maxsize=256)
+def _ingard_coefficients(
+    panel_thickness_m: float,
+    hole_diameter_m: float,
+    hole_spacing_m: float,
+) -> tuple[float, float, float]:
+    """Scalar terms of the Ingard impedance, cached per panel geometry.
+
+    Returns (R_0, c_R, c_X) such that R = R_0 + c_R*omega*delta_v and
+    X = c_X*omega. Validation runs once per geometry rather than on every
+    call from a sweep.
+    """
+    r = hole_diameter_m / 2.0
+    epsilon = _perforate_porosity(hole_diameter_m, hole_spacing_m)
+
+    # End correction: flanged opening on both sides
+    delta_end = 2.0 * 0.85 * r  # ~1.7 * r for two flanged ends
+
+    # Effective neck length
+    t_eff = panel_thickness_m + delta_end
+
+    inv_eps = 1.0 / epsilon
+    return (8.0 * ETA * t_eff * inv_eps) / (r * r), RHO_0 * inv_eps, RHO_0 * t_eff * inv_eps
+
+
 def perforated_ingard(
     freqs: np.ndarray,
     panel_thickness_m: float,
     hole_diameter_m: float,
     hole_spacing_m: float,
+    ctx: FreqCache | None = None,
 ) -> np.ndarray:
     """Acoustic impedance of a macro-perforated panel (Ingard 1953).
 
@@ -45,28 +74,21 @@ def perforated_ingard(
         panel_thickness_m: Panel thickness (m).
         hole_diameter_m: Hole diameter (m).
         hole_spacing_m: Hole centre-to-centre spacing (m).
+        ctx: Optional shared frequency cache for the same freqs (see utils.FreqCache).
 
     Returns:
         Complex acoustic impedance array Z(f), shape (N,).
     """
-    omega = 2.0 * np.pi * freqs
-    r = hole_diameter_m / 2.0
-    epsilon = _perforate_porosity(hole_diameter_m, hole_spacing_m)
-
-    # Viscous boundary layer thickness
-    delta_v = np.sqrt(2.0 * ETA / (RHO_0 * omega))
-
-    # End correction: flanged opening on both sides
-    delta_end = 2.0 * 0.85 * r  # ~1.7 * r for two flanged ends
-
-    # Effective neck length
-    t_eff = panel_thickness_m + delta_end
+    if ctx is None:
+        ctx = FreqCache(freqs)
+    omega = ctx.omega
+    R_0, c_R, c_X = _ingard_coefficients(panel_thickness_m, hole_diameter_m, hole_spacing_m)
 
     # Resistive part (viscous losses in the hole)
-    R = (8.0 * ETA * t_eff) / (epsilon * r**2) + RHO_0 * omega * delta_v / epsilon
+    R = R_0 + c_R * omega * ctx.delta_v
 
     # Reactive part (mass of air in the hole)
-    X = RHO_0 * omega * t_eff / epsilon
+    X = c_X * omega
 
     return R + 1j * X
 
@@ -76,6 +98,7 @@ def slotted_kristiansen(
     panel_thickness_m: float,
     slot_width_m: float,
     slot_spacing_m: float,
+    ctx: FreqCache | None = None,
 ) -> np.ndarray:
     """Acoustic impedance of a slotted panel (Kristiansen & Vigran 1994).
 
@@ -84,16 +107,19 @@ def slotted_kristiansen(
         panel_thickness_m: Panel thickness (m).
         slot_width_m: Slot width (m).
         slot_spacing_m: Slot centre-to-centre spacing (m).
+        ctx: Optional shared frequency cache for the same freqs (see utils.FreqCache).
 
     Returns:
         Complex acoustic impedance array Z(f), shape (N,).
     """
-    omega = 2.0 * np.pi * freqs
+    if ctx is None:
+        ctx = FreqCache(freqs)
+    omega = ctx.omega
     w = slot_width_m
     epsilon = w / slot_spacing_m  # porosity for slots
 
     # Viscous boundary layer thickness
-    delta_v = np.sqrt(2.0 * ETA / (RHO_0 * omega))
+    delta_v = ctx.delta_v
 
     # End correction for slot: 0.85 * (w/2) per end, two ends
     # w is the full slot width, so half-width is the characteristic length
@@ -101,11 +127,13 @@ def slotted_kristiansen(
 
     t_eff = panel_thickness_m + delta_end
 
+    inv_eps = 1.0 / epsilon
+
     # Resistive: viscous losses in the slot
-    R = (12.0 * ETA * t_eff) / (epsilon * w**2) + RHO_0 * omega * delta_v / epsilon
+    R = (12.0 * ETA * t_eff * inv_eps) / (w * w) + (RHO_0 * inv_eps) * omega * delta_v
 
     # Reactive: mass of air in the slot
-    X = RHO_0 * omega * t_eff / epsilon
+    X = (RHO_0 * t_eff * inv_eps) * omega
 
     return R + 1j * X
 
@@ -115,6 +143,7 @@ def mpp_maa(
     panel_thickness_m: float,
     hole_diameter_m: float,
     porosity: float,
+    ctx: FreqCache | None = None,
 ) -> np.ndarray:
     """Acoustic impedance of a micro-perforated panel (Maa 1998).
 
@@ -125,23 +154,34 @@ def mpp_maa(
         panel_thickness_m: Panel thickness (m).
         hole_diameter_m: Hole diameter (m). Typically 0.1-1.0 mm.
         porosity: Open area ratio (0 to 1).
+        ctx: Optional shared frequency cache for the same freqs (see utils.FreqCache).
 
     Returns:
         Complex acoustic impedance array Z(f), shape (N,).
     """
-    omega = 2.0 * np.pi * freqs
+    if ctx is None:
+        ctx = FreqCache(freqs)
+    omega = ctx.omega
     r = hole_diameter_m / 2.0
     d = hole_diameter_m
     t = panel_thickness_m
     p = porosity
 
-    # Perforation constant (Maa's k parameter)
-    k = d * np.sqrt(omega * RHO_0 / (4.0 * ETA))
+    inv_p = 1.0 / p
+
+    # Perforation constant (Maa's k parameter); k^2 is needed directly,
+    # so form it without squaring the sqrt
+    k_sq = (d * d * RHO_0 / (4.0 * ETA)) * omega
+    k = np.sqrt(k_sq)
 
     # Resistive part
-    R = (32.0 * ETA * t / (p * d**2)) * (np.sqrt(1.0 + k**2 / 32.0) + np.sqrt(2.0) * k * d / (32.0 * t))
+    R = (32.0 * ETA * t * inv_p / (d * d)) * (
+        np.sqrt(1.0 + k_sq * (1.0 / 32.0)) + (np.sqrt(2.0) * d / (32.0 * t)) * k
+    )
 
     # Reactive part
-    X = (RHO_0 * omega * t / p) * (1.0 + 1.0 / np.sqrt(9.0 + k**2 / 2.0) + 0.85 * d / t)
+    X = (RHO_0 * t * inv_p) * omega * (
+        (1.0 + 0.85 * d / t) + 1.0 / np.sqrt(9.0 + 0.5 * k_sq)
+    )
 
     return R + 1j * X
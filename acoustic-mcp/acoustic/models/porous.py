@@ -19,6 +19,29 @@ import numpy as np
 from acoustic.utils import C_0, GAMMA, PR, RHO_0, Z_0, ETA
 
 
+def _power_law(
+    scale: float | np.ndarray,
+    c_re: float,
+    P_re: np.ndarray,
+    c_im: float,
+    P_im: np.ndarray,
+) -> np.ndarray:
+    """Assemble scale * (1 + c_re*P_re - j*c_im*P_im) in place.
+
+    Writes straight into the real and imaginary views of the result, so the
+    empirical power-law forms build no complex temporaries.
+    """
+    out = np.empty(np.shape(P_re), dtype=complex)
+    re = out.real
+    im = out.imag
+    np.multiply(P_re, c_re, out=re)
+    re += 1.0
+    re *= scale
+    np.multiply(P_im, -c_im, out=im)
+    im *= scale
+    return out
+
+
 def delany_bazley(
     freqs: np.ndarray,
     sigma: float,
@@ -37,10 +60,16 @@ def delany_bazley(
     # Delany-Bazley use X = rho_0 * f / sigma
     X = RHO_0 * freqs / sigma
 
-    Zc = Z_0 * (1.0 + 0.0571 * X**(-0.754) - 1j * 0.0870 * X**(-0.732))
+    # X**e = exp(e*ln X): one log shared by all four power laws
+    log_X = np.log(X)
+
+    def power(e: float) -> np.ndarray:
+        return np.exp(log_X * e)
+
+    Zc = _power_law(Z_0, 0.0571, power(-0.754), 0.0870, power(-0.732))
 
     k0 = 2.0 * np.pi * freqs / C_0
-    kc = k0 * (1.0 + 0.0978 * X**(-0.700) - 1j * 0.1890 * X**(-0.595))
+    kc = _power_law(k0, 0.0978, power(-0.700), 0.1890, power(-0.595))
 
     return Zc, kc
 
@@ -62,10 +91,14 @@ def miki(
     """
     X = RHO_0 * freqs / sigma
 
-    Zc = Z_0 * (1.0 + 0.070 * X**(-0.632) - 1j * 0.107 * X**(-0.632))
+    # Real and imaginary parts share an exponent; evaluate each power once
+    X_z = X**(-0.632)
+    X_k = X**(-0.618)
+
+    Zc = _power_law(Z_0, 0.070, X_z, 0.107, X_z)
 
     k0 = 2.0 * np.pi * freqs / C_0
-    kc = k0 * (1.0 + 0.109 * X**(-0.618) - 1j * 0.160 * X**(-0.618))
+    kc = _power_law(k0, 0.109, X_k, 0.160, X_k)
 
     return Zc, kc
 
@@ -89,13 +122,17 @@ def allard_champoux(
     omega = 2.0 * np.pi * freqs
     X = RHO_0 * freqs / sigma
 
+    # Each power appears in both real and imaginary parts; evaluate once
+    X_v = X**(-0.700)
+    X_t = X**(-0.707)
+
     # Effective density (viscous effects)
-    rho_eff = RHO_0 * (1.0 + 0.0764 * X**(-0.700) - 1j * 0.136 * X**(-0.700))
+    rho_eff = RHO_0 * (1.0 + 0.0764 * X_v - 1j * 0.136 * X_v)
 
     # Effective bulk modulus (thermal effects)
     K_eff = (
         GAMMA * 101325.0  # P0 * gamma
-        / (GAMMA - (GAMMA - 1.0) / (1.0 + 0.0668 * X**(-0.707) - 1j * 0.1170 * X**(-0.707)))
+        / (GAMMA - (GAMMA - 1.0) / (1.0 + 0.0668 * X_t - 1j * 0.1170 * X_t))
     )
 
     Zc = np.sqrt(rho_eff * K_eff)
@@ -104,6 +141,19 @@ def allard_champoux(
     return Zc, kc
 
 
+def _sqrt_one_plus_j(b: np.ndarray) -> np.ndarray:
+    """Principal sqrt(1 + j*b) for real b >= 0, using only real arithmetic.
+
+    With m = |1 + jb|, sqrt(1 + jb) = sqrt((m + 1)/2) + j*b / (2*sqrt((m + 1)/2)),
+    which avoids complex sqrt and the cancellation in sqrt((m - 1)/2).
+    """
+    re = np.sqrt(0.5 * (np.hypot(1.0, b) + 1.0))
+    G = np.empty(b.shape, dtype=complex)
+    G.real = re
+    G.imag = 0.5 * b / re
+    return G
+
+
 def jca(
     freqs: np.ndarray,
     sigma: float,
@@ -132,30 +182,32 @@ def jca(
 
     # Johnson effective density (viscous effects)
     # rho_eff = rho_0 * alpha_inf * (1 + sigma*phi/(j*omega*rho_0*alpha_inf) * sqrt(1 + j*4*alpha_inf^2*eta*rho_0*omega / (sigma^2*Lambda^2*phi^2)))
-    omega_safe = np.where(omega == 0, 1e-30, omega)
+    omega_safe = np.maximum(omega, 1e-30)
+    inv_omega = 1.0 / omega_safe
 
     sigma_phi = sigma * porosity
     factor_v = (
-        4.0 * tortuosity**2 * ETA * RHO_0 * omega_safe
-        / (sigma**2 * viscous_length**2 * porosity**2)
-    )
-    G_v = np.sqrt(1.0 + 1j * factor_v)
+        4.0 * tortuosity * tortuosity * ETA * RHO_0
+        / (sigma_phi * sigma_phi * viscous_length * viscous_length)
+    ) * omega_safe
+    G_v = _sqrt_one_plus_j(factor_v)
     rho_eff = (
         RHO_0 * tortuosity
-        * (1.0 + sigma_phi / (1j * omega_safe * RHO_0 * tortuosity) * G_v)
+        * (1.0 + (sigma_phi / (1j * RHO_0 * tortuosity)) * inv_omega * G_v)
     )
 
     # Champoux-Allard effective bulk modulus (thermal effects)
     # K_eff = gamma*P0 / (gamma - (gamma-1) / (1 + 8*eta/(j*Lambda'^2*Pr*rho_0*omega) * sqrt(1 + j*rho_0*omega*Pr*Lambda'^2/(16*eta))))
+    thermal_sq = thermal_length * thermal_length
     factor_t = (
-        RHO_0 * omega_safe * PR * thermal_length**2
+        RHO_0 * PR * thermal_sq
         / (16.0 * ETA)
-    )
-    G_t = np.sqrt(1.0 + 1j * factor_t)
-    thermal_term = 1.0 + 8.0 * ETA / (1j * thermal_length**2 * PR * RHO_0 * omega_safe) * G_t
+    ) * omega_safe
+    G_t = _sqrt_one_plus_j(factor_t)
+    thermal_term = 1.0 + (8.0 * ETA / (1j * thermal_sq * PR * RHO_0)) * inv_omega * G_t
     K_eff = GAMMA * P0 / (GAMMA - (GAMMA - 1.0) / thermal_term)
 
-    Zc = np.sqrt(rho_eff * K_eff) / porosity
+    Zc = np.sqrt(rho_eff * K_eff) * (1.0 / porosity)
     kc = omega * np.sqrt(rho_eff / K_eff)
 
     return Zc, kc
@@ -9,18 +9,30 @@ References:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from functools import lru_cache, partial
+from typing import Callable, Literal
 
 import numpy as np
-from scipy.optimize import differential_evolution
+from scipy.optimize import differential_evolution, shgo
+from scipy.stats import qmc
 
 from acoustic import tmm, utils
-from acoustic.models import air, porous
+from acoustic.models import porous
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
 class LayerStack:
-    """A candidate absorber design."""
+    """A candidate absorber design.
+
+    alpha and freqs are stored as float32 for reporting; the optimization
+    itself runs in float64.
+    """
 
     material: str
     sigma: float
@@ -47,26 +59,355 @@ OPTIMIZER_MATERIALS = {
     "recycled_cotton_batt": 4000,
 }
 
+SearchMethod = Literal["de", "shgo"]
+
+PorousModel = Callable[[np.ndarray, float], tuple[np.ndarray, np.ndarray]]
+
+# Porous models driven by flow resistivity alone (jca needs microstructure)
+_POROUS_MODELS: dict[str, PorousModel] = {
+    "delany_bazley": porous.delany_bazley,
+    "miki": porous.miki,
+    "allard_champoux": porous.allard_champoux,
+}
+
+# Frequency axis shared by every optimizer run; read-only so it can be
+# handed out in results without defensive copies
+_DEFAULT_CTX = utils.shared_freq_cache(20, 20000, 12)
+_DEFAULT_FREQS = _DEFAULT_CTX.freqs
+_DEFAULT_FREQS_F32 = _DEFAULT_FREQS.astype(np.float32)
+_DEFAULT_FREQS_F32.flags.writeable = False
+
+
+def _porous_model(model: str) -> PorousModel:
+    """Resolve a porous model name, rejecting ones the optimizer cannot drive."""
+    model_fn = _POROUS_MODELS.get(model)
+    if model_fn is None:
+        raise ValueError(
+            f"Unknown porous model '{model}' for optimization. Available: {list(_POROUS_MODELS)}"
+        )
+    return model_fn
+
+
+@lru_cache(maxsize=64)
+def _porous_constants(model: str, sigma: float) -> tuple[np.ndarray, np.ndarray]:
+    """(Zc, kc) of a material on _DEFAULT_FREQS, cached per (model, sigma).
 
-def _evaluate_design(
+    The optimizer only ever sees the handful of OPTIMIZER_MATERIALS, so
+    repeat runs skip the porous model entirely. Arrays are read-only.
+    """
+    Zc, kc = _porous_model(model)(_DEFAULT_FREQS, sigma)
+    Zc.flags.writeable = False
+    kc.flags.writeable = False
+    return Zc, kc
+
+
+def _evaluate_design_precomputed(
+    freqs: np.ndarray,
+    Zc: np.ndarray,
+    kc: np.ndarray,
+    thickness_m: float | np.ndarray,
+    air_gap_m: float | np.ndarray,
+    ctx: utils.FreqCache | None = None,
+) -> np.ndarray:
+    """Normal-incidence alpha for porous layer + air gap design(s) on a rigid wall.
+
+    Thickness and air gap may be (M,) arrays, giving alpha of shape (M, N).
+    Zc and kc are the porous model's values on freqs; they depend only on
+    the material, so a search computes them once rather than on every
+    trial design. A zero air gap is an exact identity, so batched designs
+    need no per-row branching.
+
+    The porous layer and air gap matrices are never materialized: for a
+    rigid backing Zs = T[0,0] / T[1,0] of their product, and both entries
+    expand to a few elementwise terms in cos/sin of the two layers.
+    """
+    if ctx is None:
+        ctx = utils.FreqCache(freqs)
+    kd = np.expand_dims(thickness_m, -1) * kc
+    cos_p, sin_p = tmm.cos_sin(kd)
+
+    # Air gap: a zero gap gives cos = 1, sin = 0, i.e. the bare porous layer
+    k0d = np.expand_dims(air_gap_m, -1) * ctx.k0
+    cos_a = np.cos(k0d)
+    sin_a = np.sin(k0d) * (1.0 / utils.Z_0)
+
+    # T[0,0] = cos_p*cos_a - Zc*sin_p*sin_a/Z0
+    # T[1,0] = j*(sin_p*cos_a/Zc + cos_p*sin_a/Z0)
+    T00 = cos_p * cos_a - Zc * sin_p * sin_a
+    T10 = 1j * (sin_p * (cos_a / Zc) + cos_p * sin_a)
+
+    # Same rigid-wall guard as tmm.surface_impedance
+    with np.errstate(divide="ignore", invalid="ignore"):
+        Zs = T00 / T10
+    Zs = np.where(np.isfinite(Zs), Zs, 1e30 + 0j)
+    return tmm.absorption_coefficient(Zs)
+
+
+def _objective_alpha(
+    x: np.ndarray,
+    freqs: np.ndarray,
+    Zc: np.ndarray,
+    kc: np.ndarray,
+    ctx: utils.FreqCache,
+    memo: dict[bytes, np.ndarray] | None,
+) -> np.ndarray:
+    """Alpha for an objective's x; single designs are also stored in memo.
+
+    The optimizer's final design is normally one the search (DE's polish,
+    SHGO's local minimizer) evaluated on its own, so keying single designs
+    by x.tobytes() lets _run_single_material reuse that alpha. Populations
+    are not stored.
+    """
+    thickness_m, air_gap_m = x
+    alpha = _evaluate_design_precomputed(freqs, Zc, kc, thickness_m, air_gap_m, ctx)
+    if memo is not None and np.size(x) == 2:
+        memo[np.asarray(x, dtype=float).tobytes()] = alpha.reshape(-1)
+    return alpha
+
+
+def _obj_freq(
+    x: np.ndarray,
     freqs: np.ndarray,
+    Zc: np.ndarray,
+    kc: np.ndarray,
+    ctx: utils.FreqCache,
+    max_depth_m: float,
+    target_idx: int,
+    memo: dict[bytes, np.ndarray] | None = None,
+) -> np.ndarray | float:
+    """DE objective: negative alpha at the target frequency.
+
+    x is one design of shape (2,) or a population of shape (2, S). Designs
+    over the depth budget get a penalty of 1.0. Zc, kc and ctx are the
+    per-material constants bound by _run_single_material, and memo is
+    passed through to _objective_alpha.
+    """
+    thickness_m, air_gap_m = x
+    alpha = _objective_alpha(x, freqs, Zc, kc, ctx, memo)
+    return np.where(thickness_m + air_gap_m > max_depth_m, 1.0, -alpha[..., target_idx])
+
+
+def _obj_saa(
+    x: np.ndarray,
+    freqs: np.ndarray,
+    Zc: np.ndarray,
+    kc: np.ndarray,
+    ctx: utils.FreqCache,
+    max_depth_m: float,
+    memo: dict[bytes, np.ndarray] | None = None,
+) -> np.ndarray | float:
+    """DE objective: negative SAA, with the same x layout and penalty as _obj_freq."""
+    thickness_m, air_gap_m = x
+    alpha = _objective_alpha(x, freqs, Zc, kc, ctx, memo)
+    saa_vals = utils.saa_batch(np.atleast_2d(alpha), freqs)
+    if np.ndim(thickness_m) == 0:
+        saa_vals = saa_vals[0]
+    return np.where(thickness_m + air_gap_m > max_depth_m, 1.0, -saa_vals)
+
+
+@lru_cache(maxsize=32)
+def _de_init(max_depth_m: float, min_thick: float, n_full_depth: int = 6) -> np.ndarray:
+    """Initial DE population of (thickness, air gap) designs, shape (30, 2).
+
+    A seeded Latin hypercube over the bounds (DE's default init, 15 per
+    parameter) with n_full_depth members replaced by designs spread along
+    thickness + air gap = max_depth_m. Optima almost always use the full
+    depth budget, so seeding that line lets DE converge in fewer
+    generations without giving up the global coverage of the hypercube.
+
+    The population does not depend on the material, so it is cached and
+    shared read-only by every DE run with the same depth budget.
+    """
+    lo = np.array([min_thick, 0.0])
+    hi = np.array([max_depth_m, max_depth_m - min_thick])
+    # Scaled by hand: qmc.scale rejects the lo == hi thickness bound of a
+    # 5 mm budget
+    init = lo + (hi - lo) * qmc.LatinHypercube(d=2, seed=42).random(30)
+
+    thickness = np.linspace(min_thick, max_depth_m, n_full_depth)
+    init[:n_full_depth, 0] = thickness
+    init[:n_full_depth, 1] = np.clip(max_depth_m - thickness, lo[1], hi[1])
+    return utils._readonly(init)
+
+
+def _run_single_material(
+    mat_name: str,
     sigma: float,
-    thickness_m: float,
-    air_gap_m: float,
-    model_name: str = "miki",
-) -> tuple[np.ndarray, float, float]:
-    """Compute alpha, NRC, SAA for a single porous layer + air gap design."""
-    model_fn = getattr(porous, model_name)
-    Zc, kc = model_fn(freqs, sigma)
-
-    matrices = [tmm.porous_layer_matrix(freqs, Zc, kc, thickness_m)]
-    if air_gap_m > 0:
-        matrices.append(air.air_gap_matrix(freqs, air_gap_m))
-
-    alpha = tmm.absorption_from_layers(freqs, matrices)
+    max_depth_m: float,
+    model: str,
+    target_idx: int | None,
+    method: SearchMethod = "de",
+) -> LayerStack:
+    """Optimize thickness and air gap for one material.
+
+    Maximizes alpha at _DEFAULT_FREQS[target_idx], or SAA when target_idx
+    is None. Module-level so the per-material runs can be farmed out to
+    processes.
+    """
+    # Material properties and the frequency axis are fixed for the whole run
+    freqs = _DEFAULT_FREQS
+    ctx = _DEFAULT_CTX
+    Zc, kc = _porous_constants(model, sigma)
+    memo: dict[bytes, np.ndarray] = {}
+    if target_idx is None:
+        objective = partial(_obj_saa, freqs=freqs, Zc=Zc, kc=kc, ctx=ctx,
+                            max_depth_m=max_depth_m, memo=memo)
+    else:
+        objective = partial(_obj_freq, freqs=freqs, Zc=Zc, kc=kc, ctx=ctx,
+                            max_depth_m=max_depth_m, target_idx=target_idx, memo=memo)
+
+    # Bounds: thickness 5mm to max_depth, air gap 0 to max_depth
+    min_thick = 0.005
+    bounds = [
+        (min_thick, max_depth_m),
+        (0.0, max_depth_m - min_thick),
+    ]
+
+    x = None
+    if max_depth_m - min_thick < 1e-9:
+        # The bounds collapse to a point: the minimum thickness, no air gap
+        x = np.array([max_depth_m, 0.0])
+    elif method == "shgo":
+        # The depth budget is linear, so SHGO can sample only feasible
+        # designs; the objective's penalty stays as a backstop
+        try:
+            result = shgo(
+                objective,
+                bounds,
+                n=32,
+                iters=3,
+                constraints={"type": "ineq", "fun": lambda x: max_depth_m - x[0] - x[1]},
+                minimizer_kwargs={"method": "SLSQP"},
+            )
+        except IndexError:
+            # SHGO's simplicial complex refinement (scipy.optimize._shgo_lib)
+            # can index past its vertex list on near-degenerate bounds
+            logger.warning("SHGO failed for %s; falling back to DE", mat_name, exc_info=True)
+            result = None
+        if result is not None and result.success and result.x.sum() <= max_depth_m + 1e-9:
+            x = result.x
+
+    if x is None:
+        x = differential_evolution(
+            objective,
+            bounds,
+            seed=42,
+            maxiter=30,
+            tol=1e-4,
+            polish=True,
+            init=_de_init(max_depth_m, min_thick),
+            vectorized=True,
+            updating="deferred",
+        ).x
+
+    thickness_m, air_gap_m = x
+    alpha = memo.get(np.asarray(x, dtype=float).tobytes())
+    # Enforce depth constraint
+    if thickness_m + air_gap_m > max_depth_m:
+        air_gap_m = max_depth_m - thickness_m
+        alpha = None
+
+    if alpha is None:
+        alpha = _evaluate_design_precomputed(freqs, Zc, kc, thickness_m, air_gap_m, ctx)
     nrc_val = utils.nrc(alpha, freqs)
     saa_val = utils.saa(alpha, freqs)
-    return alpha, nrc_val, saa_val
+    peak_idx = int(alpha.argmax())
+
+    # np.round for every field; .item() hands plain Python floats to callers
+    return LayerStack(
+        material=mat_name,
+        sigma=sigma,
+        thickness_mm=np.round(thickness_m * 1000, 1).item(),
+        air_gap_mm=np.round(air_gap_m * 1000, 1).item(),
+        model=model,
+        alpha=utils._readonly(alpha.astype(np.float32)),
+        freqs=_DEFAULT_FREQS_F32,
+        nrc=nrc_val,
+        saa=saa_val,
+        peak_freq_hz=np.round(freqs[peak_idx], 1).item(),
+        peak_alpha=np.round(alpha[peak_idx], 4).item(),
+    )
+
+
+def _optimize_materials(
+    material_options: list[str],
+    max_depth_mm: float,
+    model: str,
+    target_idx: int | None,
+    workers: int,
+    method: SearchMethod = "de",
+) -> list[LayerStack]:
+    """Run _run_single_material for each known material, serially or in a process pool.
+
+    Results keep the order of material_options either way, so ties sort
+    identically regardless of workers.
+    """
+    if method not in ("de", "shgo"):
+        raise ValueError(f"Unknown search method: {method!r}")
+    # Resolve the model here so a bad name fails before any search or
+    # worker process starts
+    _porous_model(model)
+
+    max_depth_m = max_depth_mm / 1000.0
+    jobs = [
+        (mat_name, OPTIMIZER_MATERIALS[mat_name], max_depth_m, model, target_idx, method)
+        for mat_name in material_options
+        if mat_name in OPTIMIZER_MATERIALS
+    ]
+
+    if workers == 1 or len(jobs) < 2:
+        return [_run_single_material(*job) for job in jobs]
+
+    max_workers = (os.cpu_count() or 1) if workers == -1 else workers
+    with ProcessPoolExecutor(max_workers=min(len(jobs), max_workers)) as pool:
+        futures = [pool.submit(_run_single_material, *job) for job in jobs]
+        return [future.result() for future in futures]
+
+
+@dataclass(frozen=True)
+class _Query:
+    """Cache key of one optimizer query.
+
+    The target frequency enters only as its bin index on _DEFAULT_FREQS,
+    and target_idx=None ranks by SAA. workers rides along for the search
+    but is left out of equality and hashing, since the ranking does not
+    depend on it.
+    """
+
+    materials: tuple[str, ...]
+    max_depth_mm: float
+    model: str
+    target_idx: int | None
+    method: SearchMethod
+    workers: int = field(default=1, compare=False)
+
+
+@lru_cache(maxsize=128)
+def _best_designs(query: _Query) -> tuple[LayerStack, ...]:
+    """Top 3 designs for one optimizer query, memoized across calls.
+
+    Cached candidates hold read-only alpha arrays; callers get shallow
+    copies (see _copy_designs).
+    """
+    target_idx = query.target_idx
+    candidates = _optimize_materials(list(query.materials), query.max_depth_mm, query.model,
+                                     target_idx, query.workers, query.method)
+    if target_idx is None:
+        candidates.sort(key=lambda c: -c.saa)
+    else:
+        # Sort by alpha at target frequency (descending)
+        candidates.sort(key=lambda c: -c.alpha[target_idx])
+    return tuple(candidates[:3])
+
+
+def _copy_designs(designs: tuple[LayerStack, ...]) -> list[LayerStack]:
+    """Fresh LayerStack objects, so callers cannot alter cached results."""
+    return [replace(c) for c in designs]
+
+
+def optimizer_cache_info():
+    """Hit/miss statistics of the optimizer result cache (functools CacheInfo)."""
+    return _best_designs.cache_info()
 
 
 def optimize_for_frequency(
@@ -74,6 +415,8 @@ def optimize_for_frequency(
     max_depth_mm: float,
     material_options: list[str] | None = None,
     model: str = "miki",
+    workers: int = 1,
+    method: SearchMethod = "de",
 ) -> list[LayerStack]:
     """Find absorber designs that maximize absorption at a target frequency.
 
@@ -86,12 +429,17 @@ def optimize_for_frequency(
         material_options: List of material keys from OPTIMIZER_MATERIALS.
             If None, all materials are tried.
         model: Porous model to use.
+        workers: Processes for the independent per-material runs; 1 (default)
+            runs them serially in-process, -1 uses every core.
+        method: Global search for the 2-D (thickness, air gap) space:
+            "de" (default, differential evolution) or "shgo". SHGO falls
+            back to DE if it fails or finds no feasible design.
 
     Returns:
-        Top 3 candidate designs sorted by alpha at target frequency.
+        Top 3 candidate designs sorted by alpha at target frequency. Results
+        are memoized per query; see optimizer_cache_info.
     """
-    freqs = utils.frequency_axis(20, 20000, 12)
-    target_idx = int(np.argmin(np.abs(freqs - target_hz)))
+    target_idx = utils.nearest_index(_DEFAULT_FREQS, target_hz)
 
     if max_depth_mm < 5:
         raise ValueError(f"max_depth_mm must be at least 5 mm (got {max_depth_mm})")
@@ -99,63 +447,8 @@ def optimize_for_frequency(
     if material_options is None:
         material_options = list(OPTIMIZER_MATERIALS.keys())
 
-    candidates: list[LayerStack] = []
-
-    for mat_name in material_options:
-        sigma = OPTIMIZER_MATERIALS.get(mat_name)
-        if sigma is None:
-            continue
-
-        max_depth_m = max_depth_mm / 1000.0
-
-        def objective(x: np.ndarray, _sigma: float = sigma) -> float:
-            thickness_m, air_gap_m = x
-            if thickness_m + air_gap_m > max_depth_m:
-                return 1.0  # penalty
-            alpha, _, _ = _evaluate_design(freqs, _sigma, thickness_m, air_gap_m, model)
-            return -alpha[target_idx]  # minimize negative alpha
-
-        # Bounds: thickness 5mm to max_depth, air gap 0 to max_depth
-        min_thick = 0.005
-        bounds = [
-            (min_thick, max_depth_m),
-            (0.0, max_depth_m - min_thick),
-        ]
-
-        result = differential_evolution(
-            objective,
-            bounds,
-            seed=42,
-            maxiter=50,
-            tol=1e-4,
-            polish=True,
-        )
-
-        thickness_m, air_gap_m = result.x
-        # Enforce depth constraint
-        if thickness_m + air_gap_m > max_depth_m:
-            air_gap_m = max_depth_m - thickness_m
-
-        alpha, nrc_val, saa_val = _evaluate_design(freqs, sigma, thickness_m, air_gap_m, model)
-        peak_idx = int(np.argmax(alpha))
-
-        candidates.append(LayerStack(
-            material=mat_name,
-            sigma=sigma,
-            thickness_mm=round(thickness_m * 1000, 1),
-            air_gap_mm=round(air_gap_m * 1000, 1),
-            model=model,
-            alpha=alpha,
-            freqs=freqs,
-            nrc=nrc_val,
-            saa=saa_val,
-            peak_freq_hz=round(float(freqs[peak_idx]), 1),
-            peak_alpha=round(float(alpha[peak_idx]), 4),
-        ))
-
-    # Sort by alpha at target frequency (descending)
-    candidates.sort(key=lambda c: -c.alpha[target_idx])
-    return candidates[:3]
+    return _copy_designs(_best_designs(_Query(tuple(material_options), max_depth_mm, model,
+                                              target_idx, method, workers)))
 
 
 def optimize_nrc(
@@ -163,6 +456,8 @@ def optimize_nrc(
     material_options: list[str] | None = None,
     model: str = "miki",
     freq_range: tuple[float, float] = (200.0, 2500.0),
+    workers: int = 1,
+    method: SearchMethod = "de",
 ) -> list[LayerStack]:
     """Find absorber designs that maximize broadband NRC/SAA.
 
@@ -171,72 +466,94 @@ def optimize_nrc(
         material_options: List of material keys. If None, all are tried.
         model: Porous model to use.
         freq_range: Frequency range for SAA calculation (default 200-2500 Hz).
+        workers: Processes for the per-material runs, as for optimize_for_frequency.
+        method: Search method, as for optimize_for_frequency.
 
     Returns:
-        Top 3 candidate designs sorted by SAA.
+        Top 3 candidate designs sorted by SAA, memoized per query like
+        optimize_for_frequency.
     """
     if max_depth_mm < 5:
         raise ValueError(f"max_depth_mm must be at least 5 mm (got {max_depth_mm})")
 
-    freqs = utils.frequency_axis(20, 20000, 12)
-
     if material_options is None:
         material_options = list(OPTIMIZER_MATERIALS.keys())
 
-    candidates: list[LayerStack] = []
+    return _copy_designs(_best_designs(_Query(tuple(material_options), max_depth_mm, model,
+                                              None, method, workers)))
 
-    for mat_name in material_options:
-        sigma = OPTIMIZER_MATERIALS.get(mat_name)
-        if sigma is None:
-            continue
 
-        max_depth_m = max_depth_mm / 1000.0
+# One record per room mode; see room_mode_array
+ROOM_MODE_DTYPE = np.dtype([
+    ("frequency_hz", "f8"),
+    ("m", "i2"),
+    ("n", "i2"),
+    ("p", "i2"),
+    ("type", "U10"),
+])
 
-        def objective(x: np.ndarray, _sigma: float = sigma) -> float:
-            thickness_m, air_gap_m = x
-            if thickness_m + air_gap_m > max_depth_m:
-                return 1.0
-            _, _, saa_val = _evaluate_design(freqs, _sigma, thickness_m, air_gap_m, model)
-            return -saa_val
 
-        min_thick = 0.005
-        bounds = [
-            (min_thick, max_depth_m),
-            (0.0, max_depth_m - min_thick),
-        ]
+def room_mode_array(
+    lx: float,
+    ly: float,
+    lz: float,
+    max_order: int = 3,
+    c0: float = utils.C_0,
+) -> np.ndarray:
+    """Room mode frequencies as a structured array (see ROOM_MODE_DTYPE).
 
-        result = differential_evolution(
-            objective,
-            bounds,
-            seed=42,
-            maxiter=50,
-            tol=1e-4,
-            polish=True,
-        )
+    Same modes and order as room_mode_frequencies, without building a dict
+    per mode. frequency_hz is rounded to 0.1 Hz.
 
-        thickness_m, air_gap_m = result.x
-        if thickness_m + air_gap_m > max_depth_m:
-            air_gap_m = max_depth_m - thickness_m
+    Args:
+        lx: Room length in metres.
+        ly: Room width in metres.
+        lz: Room height in metres.
+        max_order: Maximum mode order to compute (default 3).
+        c0: Speed of sound (m/s).
 
-        alpha, nrc_val, saa_val = _evaluate_design(freqs, sigma, thickness_m, air_gap_m, model)
-        peak_idx = int(np.argmax(alpha))
+    Returns:
+        Structured array sorted by frequency_hz, ties in (m, n, p) order.
+    """
+    orders = np.arange(max_order + 1)
+    m, n, p = (g.ravel()[1:] for g in np.meshgrid(orders, orders, orders, indexing="ij"))
+    # ravel()[1:] drops (0, 0, 0), which is first in "ij" order
+
+    f = (c0 / 2.0) * np.sqrt(
+        (m / lx) ** 2 + (n / ly) ** 2 + (p / lz) ** 2
+    )
+
+    # Classify mode type by the number of non-zero indices
+    nonzero = (m > 0).astype(int) + (n > 0).astype(int) + (p > 0).astype(int)
 
-        candidates.append(LayerStack(
-            material=mat_name,
-            sigma=sigma,
-            thickness_mm=round(thickness_m * 1000, 1),
-            air_gap_mm=round(air_gap_m * 1000, 1),
-            model=model,
-            alpha=alpha,
-            freqs=freqs,
-            nrc=nrc_val,
-            saa=saa_val,
-            peak_freq_hz=round(float(freqs[peak_idx]), 1),
-            peak_alpha=round(float(alpha[peak_idx]), 4),
-        ))
+    modes = np.empty(f.shape, dtype=ROOM_MODE_DTYPE)
+    modes["frequency_hz"] = np.round(f, 1)
+    modes["m"] = m
+    modes["n"] = n
+    modes["p"] = p
+    modes["type"] = np.array(["axial", "tangential", "oblique"])[nonzero - 1]
 
-    candidates.sort(key=lambda c: -c.saa)
-    return candidates[:3]
+    # Sorting on frequency breaks ties on the remaining fields in dtype
+    # order, i.e. (m, n, p)
+    return np.sort(modes, order="frequency_hz")
+
+
+def room_modes_to_dicts(modes: np.ndarray) -> list[dict]:
+    """Convert a room_mode_array result to the list-of-dicts form.
+
+    Returns:
+        List of dicts with keys: frequency_hz, mode (m,n,p), type.
+    """
+    return [
+        {"frequency_hz": f, "mode": (m, n, p), "type": mode_type}
+        for f, m, n, p, mode_type in zip(
+            modes["frequency_hz"].tolist(),
+            modes["m"].tolist(),
+            modes["n"].tolist(),
+            modes["p"].tolist(),
+            modes["type"].tolist(),
+        )
+    ]
 
 
 def room_mode_frequencies(
@@ -262,34 +579,7 @@ def room_mode_frequencies(
     Returns:
         List of dicts with keys: frequency_hz, mode (m,n,p), type (axial/tangential/oblique).
     """
-    modes = []
-    for m in range(0, max_order + 1):
-        for n in range(0, max_order + 1):
-            for p in range(0, max_order + 1):
-                if m == 0 and n == 0 and p == 0:
-                    continue
-
-                f = (c0 / 2.0) * np.sqrt(
-                    (m / lx) ** 2 + (n / ly) ** 2 + (p / lz) ** 2
-                )
-
-                # Classify mode type
-                nonzero = sum(1 for x in (m, n, p) if x > 0)
-                if nonzero == 1:
-                    mode_type = "axial"
-                elif nonzero == 2:
-                    mode_type = "tangential"
-                else:
-                    mode_type = "oblique"
-
-                modes.append({
-                    "frequency_hz": round(float(f), 1),
-                    "mode": (m, n, p),
-                    "type": mode_type,
-                })
-
-    modes.sort(key=lambda x: x["frequency_hz"])
-    return modes
+    return room_modes_to_dicts(room_mode_array(lx, ly, lz, max_order, c0))
 
 
 def classify_design_approach(
@@ -305,6 +595,14 @@ def classify_design_approach(
     Returns:
         Dict with recommended_approach and rationale.
     """
+    # Copy so callers may mutate the result without touching the cache
+    return dict(_classify_design_approach(target_hz, depth_budget_mm))
+
+
+# typed: 500 and 500.0 hash alike but format differently in the rationale
+@lru_cache(maxsize=256, typed=True)
+def _classify_design_approach(target_hz: float, depth_budget_mm: float) -> dict:
+    """Cached body of classify_design_approach; never handed out directly."""
     if target_hz > 500:
         return {
             "recommended_approach": "porous_absorber",
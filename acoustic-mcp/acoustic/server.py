@@ -117,38 +117,62 @@ def _get_porous_model(name: str):
 def _make_absorption_result(freqs: np.ndarray, alpha: np.ndarray) -> AbsorptionResult:
     peak_idx = int(np.argmax(alpha))
     return AbsorptionResult(
-        frequencies=[round(float(f), 2) for f in freqs],
-        alpha=[round(float(a), 4) for a in alpha],
-        nrc=utils.nrc(alpha, freqs),
-        saa=utils.saa(alpha, freqs),
+        frequencies=np.round(freqs, 2).tolist(),
+        alpha=np.round(alpha, 4).tolist(),
         peak_frequency_hz=round(float(freqs[peak_idx]), 1),
         peak_alpha=round(float(alpha[peak_idx]), 4),
-        octave_summary=utils.octave_band_summary(alpha, freqs),
+        **utils.absorption_metrics(alpha, freqs),
     )
 
 
 def _build_perforated_impedance(
     freqs: np.ndarray,
     spec: PerforatedLayerSpec,
+    ctx: utils.FreqCache | None = None,
 ) -> np.ndarray:
     t_m = spec.panel_thickness_mm / 1000.0
     if spec.panel_type == "perforated":
         return perforated.perforated_ingard(
-            freqs, t_m, spec.hole_diameter_mm / 1000.0, spec.hole_spacing_mm / 1000.0
+            freqs, t_m, spec.hole_diameter_mm / 1000.0, spec.hole_spacing_mm / 1000.0, ctx=ctx
         )
     elif spec.panel_type == "slotted":
         return perforated.slotted_kristiansen(
-            freqs, t_m, spec.hole_diameter_mm / 1000.0, spec.hole_spacing_mm / 1000.0
+            freqs, t_m, spec.hole_diameter_mm / 1000.0, spec.hole_spacing_mm / 1000.0, ctx=ctx
         )
     elif spec.panel_type == "mpp":
         porosity = perforated._perforate_porosity(
             spec.hole_diameter_mm / 1000.0, spec.hole_spacing_mm / 1000.0
         )
-        return perforated.mpp_maa(freqs, t_m, spec.hole_diameter_mm / 1000.0, porosity)
+        return perforated.mpp_maa(freqs, t_m, spec.hole_diameter_mm / 1000.0, porosity, ctx=ctx)
     else:
         raise ValueError(f"Unknown panel type '{spec.panel_type}'. Use: perforated, slotted, mpp")
 
 
+# Strip case and the separators users type inconsistently ("OC-703", "oc 703")
+_MATERIAL_SEPARATORS = str.maketrans("", "", " -_")
+
+
+def _normalize_material_text(text: str) -> str:
+    return text.lower().translate(_MATERIAL_SEPARATORS)
+
+
+# Normalised key + name per material, built once instead of on every lookup
+_MATERIAL_SEARCH: tuple[tuple[str, dict], ...] = tuple(
+    (_normalize_material_text(key + data["name"]), data)
+    for key, data in porous.MATERIAL_DATABASE.items()
+)
+
+
+def _material_info(data: dict) -> MaterialInfo:
+    return MaterialInfo(
+        name=data["name"],
+        sigma_range=data["sigma_range"],
+        sigma_typical=data["sigma_typical"],
+        density_kg_m3=data["density_kg_m3"],
+        notes=data["notes"],
+    )
+
+
 # ---------------------------------------------------------------------------
 # MCP Tools
 # ---------------------------------------------------------------------------
@@ -184,18 +208,18 @@ def calculate_porous_layer(
     if model == "jca":
         raise ValueError("JCA model requires 5 microstructure parameters. Use calculate_multilayer with a full JCA layer spec instead.")
 
-    freqs = utils.frequency_axis(20, 20000, 12)
+    ctx = utils.shared_freq_cache(20, 20000, 12)
+    freqs = ctx.freqs
     model_fn = _get_porous_model(model)
     Zc, kc = model_fn(freqs, sigma)
 
     matrices = [tmm.porous_layer_matrix(freqs, Zc, kc, thickness_mm / 1000.0)]
     if air_gap_mm > 0:
-        matrices.append(air.air_gap_matrix(freqs, air_gap_mm / 1000.0))
+        matrices.append(air.air_gap_matrix(freqs, air_gap_mm / 1000.0, ctx=ctx))
 
     if incidence == "diffuse":
         # Locally-reacting surface approximation for diffuse field
-        T = tmm.multiply_chain(matrices)
-        Zs = tmm.surface_impedance(T)
+        Zs = tmm.surface_impedance_from_layers(matrices)
         alpha = diffuse_field_alpha_from_impedance(Zs)
     else:
         alpha = tmm.absorption_from_layers(freqs, matrices)
@@ -217,7 +241,8 @@ def calculate_perforated_panel(
     The panel acts as a tuned absorber, with peak absorption near a resonance
     frequency determined by the panel geometry and cavity depth.
     """
-    freqs = utils.frequency_axis(20, 20000, 12)
+    ctx = utils.shared_freq_cache(20, 20000, 12)
+    freqs = ctx.freqs
 
     spec = PerforatedLayerSpec(
         hole_diameter_mm=hole_diameter_mm,
@@ -225,11 +250,11 @@ def calculate_perforated_panel(
         panel_thickness_mm=panel_thickness_mm,
         panel_type=panel_type,
     )
-    Z = _build_perforated_impedance(freqs, spec)
+    Z = _build_perforated_impedance(freqs, spec, ctx)
 
     matrices = [
         tmm.impedance_sheet_matrix(freqs, Z),
-        air.air_gap_matrix(freqs, air_gap_mm / 1000.0),
+        air.air_gap_matrix(freqs, air_gap_mm / 1000.0, ctx=ctx),
     ]
     alpha = tmm.absorption_from_layers(freqs, matrices)
     return _make_absorption_result(freqs, alpha)
@@ -252,13 +277,14 @@ def calculate_membrane_absorber(
     - 1mm steel: ~7.8 kg/m²
     - Vinyl sheet: ~3-5 kg/m²
     """
-    freqs = utils.frequency_axis(20, 20000, 12)
+    ctx = utils.shared_freq_cache(20, 20000, 12)
+    freqs = ctx.freqs
 
     f0 = membrane.panel_absorber_resonance(mass_per_area_kg_m2, air_gap_mm / 1000.0)
 
     matrices = [
-        membrane.membrane_matrix(freqs, mass_per_area_kg_m2),
-        air.air_gap_matrix(freqs, air_gap_mm / 1000.0),
+        membrane.membrane_matrix(freqs, mass_per_area_kg_m2, ctx=ctx),
+        air.air_gap_matrix(freqs, air_gap_mm / 1000.0, ctx=ctx),
     ]
     alpha = tmm.absorption_from_layers(freqs, matrices)
     result = _make_absorption_result(freqs, alpha)
@@ -279,15 +305,16 @@ def calculate_helmholtz(
     Returns the resonance frequency, complex impedance curve, and absorption area
     as a function of frequency.
     """
-    freqs = utils.frequency_axis(20, 20000, 12)
+    ctx = utils.shared_freq_cache(20, 20000, 12)
+    freqs = ctx.freqs
 
     neck_l = neck_length_mm / 1000.0
     neck_r = neck_radius_mm / 1000.0
     cav_vol = (cavity_width_mm / 1000.0) ** 2 * (cavity_depth_mm / 1000.0)
 
     f0 = helmholtz.helmholtz_resonance(neck_l, neck_r, cav_vol)
-    Z = helmholtz.helmholtz_impedance(freqs, neck_l, neck_r, cav_vol)
-    A = helmholtz.helmholtz_absorption_area(freqs, neck_l, neck_r, cav_vol)
+    Z = helmholtz.helmholtz_impedance(freqs, neck_l, neck_r, cav_vol, ctx=ctx)
+    A = helmholtz.helmholtz_absorption_area(freqs, neck_l, neck_r, cav_vol, ctx=ctx)
 
     wavelength_at_f0 = utils.C_0 / f0
     A_max_theoretical = wavelength_at_f0**2 / (2.0 * np.pi)
@@ -296,10 +323,10 @@ def calculate_helmholtz(
 
     return HelmholtzResult(
         resonance_frequency_hz=round(f0, 1),
-        frequencies=[round(float(f), 2) for f in freqs],
-        impedance_real=[round(float(z), 2) for z in np.real(Z)],
-        impedance_imag=[round(float(z), 2) for z in np.imag(Z)],
-        absorption_area_m2=[round(float(a), 6) for a in A],
+        frequencies=np.round(freqs, 2).tolist(),
+        impedance_real=np.round(Z.real, 2).tolist(),
+        impedance_imag=np.round(Z.imag, 2).tolist(),
+        absorption_area_m2=np.round(A, 6).tolist(),
         peak_absorption_area_m2=round(float(A[peak_idx]), 6),
         theoretical_max_area_m2=round(A_max_theoretical, 4),
     )
@@ -332,7 +359,8 @@ def calculate_multilayer(
         {"type": "air", "thickness_mm": 100}
     ]
     """
-    freqs = utils.frequency_axis(20, 20000, 12)
+    ctx = utils.shared_freq_cache(20, 20000, 12)
+    freqs = ctx.freqs
     matrices = []
 
     for layer_dict in layers:
@@ -346,16 +374,16 @@ def calculate_multilayer(
 
         elif layer_type == "air":
             spec = AirLayerSpec(**layer_dict)
-            matrices.append(air.air_gap_matrix(freqs, spec.thickness_mm / 1000.0))
+            matrices.append(air.air_gap_matrix(freqs, spec.thickness_mm / 1000.0, ctx=ctx))
 
         elif layer_type == "perforated":
             spec = PerforatedLayerSpec(**layer_dict)
-            Z = _build_perforated_impedance(freqs, spec)
+            Z = _build_perforated_impedance(freqs, spec, ctx)
             matrices.append(tmm.impedance_sheet_matrix(freqs, Z))
 
         elif layer_type == "membrane":
             spec = MembraneLayerSpec(**layer_dict)
-            matrices.append(membrane.membrane_matrix(freqs, spec.mass_per_area_kg_m2))
+            matrices.append(membrane.membrane_matrix(freqs, spec.mass_per_area_kg_m2, ctx=ctx))
 
         else:
             raise ValueError(f"Unknown layer type '{layer_type}'. Use: porous, air, perforated, membrane")
@@ -377,29 +405,10 @@ def material_properties(
     the search term. Use this to find the right sigma value for porous absorber
     calculations.
     """
-    query = material_name.lower().replace(" ", "").replace("-", "").replace("_", "")
-    results = []
-    for key, data in porous.MATERIAL_DATABASE.items():
-        searchable = (key + data["name"]).lower().replace(" ", "").replace("-", "").replace("_", "")
-        if query in searchable:
-            results.append(MaterialInfo(
-                name=data["name"],
-                sigma_range=data["sigma_range"],
-                sigma_typical=data["sigma_typical"],
-                density_kg_m3=data["density_kg_m3"],
-                notes=data["notes"],
-            ))
-    if not results:
-        # Return all materials if no match
-        for data in porous.MATERIAL_DATABASE.values():
-            results.append(MaterialInfo(
-                name=data["name"],
-                sigma_range=data["sigma_range"],
-                sigma_typical=data["sigma_typical"],
-                density_kg_m3=data["density_kg_m3"],
-                notes=data["notes"],
-            ))
-    return results
+    query = _normalize_material_text(material_name)
+    matches = [data for searchable, data in _MATERIAL_SEARCH if query in searchable]
+    # Return all materials if no match
+    return [_material_info(data) for data in (matches or porous.MATERIAL_DATABASE.values())]
 
 
 @mcp.tool()
@@ -503,10 +512,10 @@ def optimize_absorber(
 
     # Room mode analysis if dimensions provided
     if room_dims_m and len(room_dims_m) == 3:
-        modes = optimizer.room_mode_frequencies(room_dims_m[0], room_dims_m[1], room_dims_m[2])
+        modes = optimizer.room_mode_array(room_dims_m[0], room_dims_m[1], room_dims_m[2])
         # Filter to modes near the target frequency
-        nearby = [m for m in modes if abs(m["frequency_hz"] - target_hz) < target_hz * 0.3]
-        result["room_modes_near_target"] = nearby[:10]
+        nearby = modes[np.abs(modes["frequency_hz"] - target_hz) < target_hz * 0.3]
+        result["room_modes_near_target"] = optimizer.room_modes_to_dicts(nearby[:10])
 
     # Design classification
     result["design_guidance"] = optimizer.classify_design_approach(target_hz, max_depth_mm)
@@ -4,6 +4,9 @@ Frequency axes, standard metrics (NRC, SAA), and air properties
 at standard conditions (20°C, 101.325 kPa).
 """
 
+import math
+from functools import cached_property, lru_cache
+
 import numpy as np
 
 # Air properties at 20°C, 101.325 kPa
@@ -31,7 +34,7 @@ THIRD_OCTAVE_CENTERS = np.array([
     20, 25, 31.5, 40, 50, 63, 80, 100, 125, 160,
     200, 250, 315, 400, 500, 630, 800, 1000, 1250, 1600,
     2000, 2500, 3150, 4000, 5000, 6300, 8000, 10000, 12500, 16000, 20000,
-])
+], dtype=float)
 
 # NRC frequencies (ASTM C423)
 NRC_FREQUENCIES = np.array([250.0, 500.0, 1000.0, 2000.0])
@@ -44,6 +47,12 @@ SAA_FREQUENCIES = np.array([
 # Octave band center frequencies for summary
 OCTAVE_CENTERS = np.array([63.0, 125.0, 250.0, 500.0, 1000.0, 2000.0, 4000.0])
 
+# Shared by every caller (and their log10 values are cached below); freeze them
+THIRD_OCTAVE_CENTERS.flags.writeable = False
+NRC_FREQUENCIES.flags.writeable = False
+SAA_FREQUENCIES.flags.writeable = False
+OCTAVE_CENTERS.flags.writeable = False
+
 
 def frequency_axis(
     f_min: float = 20.0,
@@ -58,11 +67,103 @@ def frequency_axis(
         points_per_octave: Number of points per octave (12 = third-octave resolution).
 
     Returns:
-        1-D array of frequencies in Hz.
+        1-D array of frequencies in Hz. A fresh copy, so callers may modify it.
+    """
+    return _frequency_axis(f_min, f_max, points_per_octave).copy()
+
+
+@lru_cache(maxsize=32)
+def _frequency_axis(f_min: float, f_max: float, points_per_octave: int) -> np.ndarray:
+    """frequency_axis, computed once per argument set; the result is read-only."""
+    n_octaves = math.log2(f_max / f_min)
+    n_points = math.ceil(n_octaves * points_per_octave) + 1
+    return _readonly(np.geomspace(f_min, f_max, n_points))
+
+
+def viscous_boundary_layer(omega: np.ndarray, rho0: float = RHO_0) -> np.ndarray:
+    """Viscous boundary-layer thickness sqrt(2*eta/(rho_0*omega)) in metres."""
+    return np.sqrt((2.0 * ETA / rho0) / omega)
+
+
+class FreqCache:
+    """Frequency-derived arrays shared by layer models on a common axis.
+
+    Building a multi-layer stack evaluates several models at the same
+    frequencies. Passing one FreqCache to each avoids recomputing angular
+    frequency, the free-air wavenumber, and the viscous boundary-layer
+    thickness per layer. Quantities are computed lazily on first access.
+
+    Args:
+        freqs: Frequency array (Hz), shape (N,).
+    """
+
+    def __init__(self, freqs: np.ndarray):
+        self.freqs = np.asarray(freqs, dtype=float)
+
+    @cached_property
+    def omega(self) -> np.ndarray:
+        """Angular frequency 2*pi*f (rad/s)."""
+        return _readonly(2.0 * np.pi * self.freqs)
+
+    @cached_property
+    def k0(self) -> np.ndarray:
+        """Free-air wavenumber omega/c_0 (rad/m) at standard conditions."""
+        return _readonly(self.omega / C_0)
+
+    @cached_property
+    def delta_v(self) -> np.ndarray:
+        """Viscous boundary-layer thickness sqrt(2*eta/(rho_0*omega)) (m)."""
+        return _readonly(viscous_boundary_layer(self.omega))
+
+
+def _readonly(a: np.ndarray) -> np.ndarray:
+    """Mark a cached array read-only so no caller can corrupt it in place.
+
+    A scalar frequency yields NumPy scalars, which are immutable already
+    and have no flags to set; they are returned as is.
+    """
+    if isinstance(a, np.ndarray):
+        a.flags.writeable = False
+    return a
+
+
+@lru_cache(maxsize=8)
+def shared_freq_cache(
+    f_min: float = 20.0,
+    f_max: float = 20000.0,
+    points_per_octave: int = 12,
+) -> FreqCache:
+    """FreqCache over frequency_axis(f_min, f_max, points_per_octave), built once.
+
+    Every tool evaluates on the same axis; sharing one cache means the axis
+    and its derived arrays are computed once per process rather than per
+    call. The axis and derived arrays are read-only.
+
+    Returns:
+        Shared FreqCache; its freqs attribute is the frequency axis.
+    """
+    freqs = _frequency_axis(f_min, f_max, points_per_octave)
+    _LOG10_AXES[id(freqs)] = (freqs, _readonly(np.log10(freqs)))
+    return FreqCache(freqs)
+
+
+def nearest_index(freqs: np.ndarray, target: float) -> int:
+    """Index of the value in ascending freqs nearest to target.
+
+    Binary search instead of argmin(|freqs - target|), with no temporary
+    array; ties go to the lower index, as with argmin.
+
+    Args:
+        freqs: Ascending frequency array (Hz).
+        target: Frequency to locate (Hz).
+
+    Returns:
+        Index into freqs.
     """
-    n_octaves = np.log2(f_max / f_min)
-    n_points = int(np.ceil(n_octaves * points_per_octave)) + 1
-    return np.geomspace(f_min, f_max, n_points)
+    i = int(np.searchsorted(freqs, target))
+    if i == len(freqs) or (i > 0 and target - freqs[i - 1] <= freqs[i] - target):
+        return i - 1
+    return i
 
 
 def third_octave_bands(
@@ -71,12 +172,62 @@ def third_octave_bands(
 ) -> np.ndarray:
     """Return ISO 266 third-octave band center frequencies within range."""
     mask = (THIRD_OCTAVE_CENTERS >= f_min) & (THIRD_OCTAVE_CENTERS <= f_max)
-    return THIRD_OCTAVE_CENTERS[mask].copy()
+    # Boolean indexing already returns a new array
+    return THIRD_OCTAVE_CENTERS[mask]
+
+
+# log10 of the metric target frequencies, computed once
+_LOG10_NRC = np.log10(NRC_FREQUENCIES)
+_LOG10_SAA = np.log10(SAA_FREQUENCIES)
+_LOG10_OCTAVE = np.log10(OCTAVE_CENTERS)
+_LOG10_ALL_TARGETS = np.concatenate([_LOG10_NRC, _LOG10_SAA, _LOG10_OCTAVE])
+_OCTAVE_KEYS = tuple(str(int(f)) for f in OCTAVE_CENTERS)
+
+# log10 of each shared (read-only) axis, keyed by id. The entry holds the
+# axis itself, so the id cannot be reused while the entry exists.
+_LOG10_AXES: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+
 
+def _log10_axis(freqs: np.ndarray) -> np.ndarray:
+    """log10(freqs), looked up instead of recomputed for shared axes."""
+    entry = _LOG10_AXES.get(id(freqs))
+    if entry is not None and entry[0] is freqs:
+        return entry[1]
+    return np.log10(freqs)
 
-def _interpolate_at(alpha: np.ndarray, freqs: np.ndarray, target_freqs: np.ndarray) -> np.ndarray:
-    """Interpolate alpha values at target frequencies using log-frequency interpolation."""
-    return np.interp(np.log10(target_freqs), np.log10(freqs), alpha)
+
+def _interpolate_at(alpha: np.ndarray, freqs: np.ndarray, log_targets: np.ndarray) -> np.ndarray:
+    """Interpolate alpha at target frequencies (given as log10) on a log-frequency axis."""
+    return np.interp(log_targets, _log10_axis(freqs), alpha)
+
+
+def _interpolate_rows(alpha: np.ndarray, freqs: np.ndarray, log_targets: np.ndarray) -> np.ndarray:
+    """_interpolate_at applied to each row of a 2-D alpha.
+
+    Uses np.interp's own formula, fp[j] + slope * (x - xp[j]), so each row
+    matches the 1-D result bit for bit. Like np.interp, targets outside the
+    axis take the end values instead of being extrapolated.
+    """
+    # np.interp evaluates in float64 whatever fp's dtype; do the same so a
+    # float32 batch rounds exactly like the per-row metrics
+    alpha = np.asarray(alpha, dtype=float)
+    log_freqs = _log10_axis(freqs)
+    j = np.searchsorted(log_freqs, log_targets, side="right") - 1
+    np.clip(j, 0, len(log_freqs) - 2, out=j)
+    x0 = log_freqs[j]
+    f0 = alpha[:, j]
+    slope = alpha[:, j + 1] - f0
+    slope /= log_freqs[j + 1] - x0
+    slope *= log_targets - x0
+    slope += f0
+    # np.interp returns fp[-1] exactly at and beyond the last point
+    below = log_targets < log_freqs[0]
+    above = log_targets >= log_freqs[-1]
+    if below.any():
+        slope[:, below] = alpha[:, :1]
+    if above.any():
+        slope[:, above] = alpha[:, -1:]
+    return slope
 
 
 def nrc(alpha: np.ndarray, freqs: np.ndarray) -> float:
@@ -92,11 +243,34 @@ def nrc(alpha: np.ndarray, freqs: np.ndarray) -> float:
     Returns:
         NRC value (0.0 to 1.0).
     """
-    values = _interpolate_at(alpha, freqs, NRC_FREQUENCIES)
-    raw = float(np.mean(np.clip(values, 0.0, 1.0)))
+    values = _interpolate_at(alpha, freqs, _LOG10_NRC)
+    np.clip(values, 0.0, 1.0, out=values)
+    raw = float(values.sum()) / values.size
     return round(raw * 20) / 20  # round to nearest 0.05
 
 
+def nrc_batch(alpha: np.ndarray, freqs: np.ndarray) -> np.ndarray:
+    """NRC of many designs at once; row i equals nrc(alpha[i], freqs).
+
+    Args:
+        alpha: Absorption coefficient array, shape (M, N).
+        freqs: Corresponding frequency array in Hz, shape (N,).
+
+    Returns:
+        NRC values, shape (M,).
+    """
+    values = _interpolate_rows(alpha, freqs, _LOG10_NRC)
+    np.clip(values, 0.0, 1.0, out=values)
+    raw = values.sum(axis=-1)
+    raw /= values.shape[-1]
+    # round() on a float rounds half to even, as np.rint does, so this is
+    # nrc()'s round(raw * 20) / 20 exactly
+    raw *= 20.0
+    np.rint(raw, out=raw)
+    raw /= 20.0
+    return raw
+
+
 def saa(alpha: np.ndarray, freqs: np.ndarray) -> float:
     """Sound Absorption Average per ASTM C423-09a.
 
@@ -110,11 +284,34 @@ def saa(alpha: np.ndarray, freqs: np.ndarray) -> float:
     Returns:
         SAA value (0.0 to 1.0).
     """
-    values = _interpolate_at(alpha, freqs, SAA_FREQUENCIES)
-    raw = float(np.mean(np.clip(values, 0.0, 1.0)))
+    values = _interpolate_at(alpha, freqs, _LOG10_SAA)
+    np.clip(values, 0.0, 1.0, out=values)
+    raw = float(values.sum()) / values.size
     return round(raw, 2)
 
 
+def saa_batch(alpha: np.ndarray, freqs: np.ndarray) -> np.ndarray:
+    """SAA of many designs at once; row i equals saa(alpha[i], freqs).
+
+    Interpolates every row in one gather instead of one np.interp call per
+    design, for optimizer populations evaluated a generation at a time.
+
+    Args:
+        alpha: Absorption coefficient array, shape (M, N).
+        freqs: Corresponding frequency array in Hz, shape (N,).
+
+    Returns:
+        SAA values, shape (M,).
+    """
+    values = _interpolate_rows(alpha, freqs, _LOG10_SAA)
+    np.clip(values, 0.0, 1.0, out=values)
+    raw = values.sum(axis=-1)
+    raw /= values.shape[-1]
+    # Python's round(x, 2) is correctly rounded; np.round(x, 2) scales by 100
+    # first and can land the other way on near-ties (e.g. 0.005, 0.015)
+    return np.array([round(v, 2) for v in raw.tolist()])
+
+
 def octave_band_summary(alpha: np.ndarray, freqs: np.ndarray) -> dict[str, float]:
     """Absorption coefficients at standard octave band centers.
 
@@ -122,8 +319,38 @@ def octave_band_summary(alpha: np.ndarray, freqs: np.ndarray) -> dict[str, float
         Dict with keys like "63", "125", "250", "500", "1000", "2000", "4000"
         and float alpha values.
     """
-    values = _interpolate_at(alpha, freqs, OCTAVE_CENTERS)
+    values = _interpolate_at(alpha, freqs, _LOG10_OCTAVE)
+    return _octave_dict(values)
+
+
+def _octave_dict(values: np.ndarray) -> dict[str, float]:
+    """Clip and round interpolated octave-band values into the summary dict."""
+    np.clip(values, 0.0, 1.0, out=values)
+    return dict(zip(_OCTAVE_KEYS, np.round(values, 3).tolist()))
+
+
+def absorption_metrics(alpha: np.ndarray, freqs: np.ndarray) -> dict:
+    """NRC, SAA and octave band summary from a single interpolation.
+
+    Equivalent to calling nrc, saa and octave_band_summary separately, but
+    interpolates all 23 target frequencies in one np.interp call.
+
+    Args:
+        alpha: Absorption coefficient array.
+        freqs: Corresponding frequency array in Hz.
+
+    Returns:
+        Dict with "nrc", "saa" and "octave_summary" entries, as returned by
+        the individual functions.
+    """
+    values = _interpolate_at(alpha, freqs, _LOG10_ALL_TARGETS)
+    n_nrc = len(NRC_FREQUENCIES)
+    n_saa = len(SAA_FREQUENCIES)
+    np.clip(values, 0.0, 1.0, out=values)
+    nrc_raw = float(values[:n_nrc].sum()) / n_nrc
+    saa_raw = float(values[n_nrc:n_nrc + n_saa].sum()) / n_saa
     return {
-        str(int(f)): round(float(np.clip(v, 0.0, 1.0)), 3)
-        for f, v in zip(OCTAVE_CENTERS, values)
+        "nrc": round(nrc_raw * 20) / 20,
+        "saa": round(saa_raw, 2),
+        "octave_summary": _octave_dict(values[n_nrc + n_saa:]),
     }
@@ -0,0 +1,24 @@
+"""Shared fixtures for the test suite."""
+
+import numpy as np
+import pytest
+
+from acoustic import utils
+from acoustic.models.porous import miki
+
+
+@pytest.fixture(scope="session")
+def freqs_default() -> np.ndarray:
+    """Standard 20 Hz - 20 kHz axis at 12 points per octave, read-only."""
+    freqs = utils.frequency_axis(20, 20000, 12)
+    freqs.flags.writeable = False
+    return freqs
+
+
+@pytest.fixture(scope="session")
+def miki_oc703(freqs_default) -> tuple[np.ndarray, np.ndarray]:
+    """Miki (Zc, kc) for OC703 (sigma = 13000) on freqs_default, read-only."""
+    Zc, kc = miki(freqs_default, 13000)
+    Zc.flags.writeable = False
+    kc.flags.writeable = False
+    return Zc, kc
@@ -10,7 +10,7 @@ from acoustic.models.helmholtz import (
 )
 from acoustic.models.membrane import membrane_matrix, panel_absorber_resonance
 from acoustic.models.perforated import mpp_maa, perforated_ingard, slotted_kristiansen
-from acoustic.utils import C_0
+from acoustic.utils import C_0, nearest_index
 
 
 class TestHelmholtzResonance:
@@ -48,7 +48,7 @@ class TestHelmholtzImpedance:
         f0 = helmholtz_resonance(0.002, 0.001, 1e-6)
 
         # Find frequency closest to resonance
-        idx = np.argmin(np.abs(freqs - f0))
+        idx = nearest_index(freqs, f0)
         # Imaginary part should be near zero at resonance
         assert abs(np.imag(Z[idx])) < abs(np.imag(Z[0]))
 
@@ -130,3 +130,20 @@ class TestPerforated:
         """Imaginary part should be positive (mass-like reactance)."""
         Z = perforated_ingard(freqs, 0.003, 0.005, 0.020)
         assert np.all(np.imag(Z) > 0)
+
+
+@pytest.mark.parametrize(
+    "model, args",
+    [
+        (helmholtz_impedance, (0.01, 0.005, 50e-6)),
+        (helmholtz_absorption_area, (0.01, 0.005, 50e-6)),
+        (perforated_ingard, (0.003, 0.005, 0.020)),
+        (slotted_kristiansen, (0.003, 0.003, 0.015)),
+        (mpp_maa, (0.001, 0.0003, 0.01)),
+    ],
+)
+def test_scalar_frequency_matches_array(model, args):
+    """A scalar frequency gives the same value as a one-element array."""
+    scalar = model(500.0, *args)
+    array = model(np.array([500.0]), *args)
+    assert complex(scalar) == pytest.approx(complex(array[0]))
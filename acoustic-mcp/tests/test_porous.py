@@ -54,17 +54,25 @@ class TestPorousModels:
         assert Zc.dtype == complex
         assert kc.dtype == complex
 
-    def test_real_part_positive(self, freqs, sigma_oc703):
+    @pytest.mark.parametrize("model", [delany_bazley, miki])
+    def test_real_part_positive(self, model, freqs, sigma_oc703):
         """Real part of Zc should be positive (dissipative medium)."""
-        for model in [delany_bazley, miki]:
-            Zc, kc = model(freqs, sigma_oc703)
-            assert np.all(np.real(Zc) > 0), f"{model.__name__}: Zc real part should be positive"
+        Zc, kc = model(freqs, sigma_oc703)
+        assert np.all(np.real(Zc) > 0), f"{model.__name__}: Zc real part should be positive"
 
-    def test_imaginary_part_negative(self, freqs, sigma_oc703):
+    @pytest.mark.parametrize("model", [delany_bazley, miki])
+    def test_imaginary_part_negative(self, model, freqs, sigma_oc703):
         """Imaginary part of kc should be negative (attenuation)."""
-        for model in [delany_bazley, miki]:
-            Zc, kc = model(freqs, sigma_oc703)
-            assert np.all(np.imag(kc) < 0), f"{model.__name__}: kc imaginary part should be negative"
+        Zc, kc = model(freqs, sigma_oc703)
+        assert np.all(np.imag(kc) < 0), f"{model.__name__}: kc imaginary part should be negative"
+
+    @pytest.mark.parametrize("model", [delany_bazley, miki, allard_champoux])
+    def test_scalar_frequency_matches_array(self, model, sigma_oc703):
+        """A scalar frequency gives the same (Zc, kc) as a one-element array."""
+        Zc, kc = model(500.0, sigma_oc703)
+        Zc_arr, kc_arr = model(np.array([500.0]), sigma_oc703)
+        assert complex(Zc) == pytest.approx(complex(Zc_arr[0]))
+        assert complex(kc) == pytest.approx(complex(kc_arr[0]))
 
     def test_higher_sigma_higher_impedance(self, freqs):
         """Higher flow resistivity should give higher characteristic impedance magnitude."""
@@ -73,15 +81,15 @@ class TestPorousModels:
         # At low frequencies, higher sigma → higher |Zc|
         assert np.abs(Zc_high[0]) > np.abs(Zc_low[0])
 
-    def test_models_converge_at_high_freq(self, sigma_oc703):
+    @pytest.mark.parametrize("model", [delany_bazley, miki])
+    def test_models_converge_at_high_freq(self, model, sigma_oc703):
         """All single-parameter models should converge toward Z_0 at high frequencies."""
         freqs = np.array([10000.0, 20000.0])
         from acoustic.utils import Z_0
-        for model in [delany_bazley, miki]:
-            Zc, _ = model(freqs, sigma_oc703)
-            # At high frequency, Zc should approach Z_0
-            ratio = np.abs(Zc[-1]) / Z_0
-            assert 0.8 < ratio < 1.5, f"{model.__name__}: |Zc| should approach Z_0 at high freq"
+        Zc, _ = model(freqs, sigma_oc703)
+        # At high frequency, Zc should approach Z_0
+        ratio = np.abs(Zc[-1]) / Z_0
+        assert 0.8 < ratio < 1.5, f"{model.__name__}: |Zc| should approach Z_0 at high freq"
 
 
 class TestMaterialDatabase:
@@ -4,7 +4,9 @@ import numpy as np
 import pytest
 
 from acoustic import tmm, utils
+from acoustic.diffuse import diffuse_field_alpha_from_impedance
 from acoustic.models.air import air_gap_matrix
+from acoustic.models.membrane import membrane_matrix
 
 
 class TestUtils:
@@ -19,6 +21,29 @@ class TestUtils:
         # 4 octaves at 1 point/octave = 5 points
         assert len(freqs) == 5
 
+    def test_shared_freq_cache(self):
+        """Shared cache is built once and its arrays cannot be modified."""
+        ctx = utils.shared_freq_cache(20, 20000, 12)
+        assert utils.shared_freq_cache(20, 20000, 12) is ctx
+        np.testing.assert_array_equal(ctx.freqs, utils.frequency_axis(20, 20000, 12))
+        for a in (ctx.freqs, ctx.omega, ctx.k0, ctx.delta_v):
+            assert not a.flags.writeable
+
+    def test_metrics_on_shared_axis_match_copy(self):
+        """Cached log10 of the shared axis should give the same metrics as a fresh axis."""
+        freqs = utils.shared_freq_cache(20, 20000, 12).freqs
+        alpha = np.linspace(0.1, 0.9, len(freqs))
+        fresh = freqs.copy()
+        assert utils.nrc(alpha, freqs) == utils.nrc(alpha, fresh)
+        assert utils.saa(alpha, freqs) == utils.saa(alpha, fresh)
+        assert utils.octave_band_summary(alpha, freqs) == utils.octave_band_summary(alpha, fresh)
+
+    def test_nearest_index_matches_argmin(self):
+        freqs = utils.frequency_axis(20, 20000, 12)
+        targets = np.concatenate([[1.0, 20.0, 20000.0, 1e6], freqs[:-1] + 0.5 * np.diff(freqs)])
+        for x in np.concatenate([targets, np.random.default_rng(0).uniform(10, 25000, 200)]):
+            assert utils.nearest_index(freqs, x) == np.argmin(np.abs(freqs - x))
+
     def test_third_octave_bands(self):
         bands = utils.third_octave_bands(200, 2500)
         assert 250 in bands
@@ -27,6 +52,14 @@ class TestUtils:
         assert 2000 in bands
         assert 100 not in bands
 
+    def test_third_octave_bands_dtype_and_copy(self):
+        """Bands are float64 (31.5 Hz always made them so) and safe to modify."""
+        bands = utils.third_octave_bands(100, 200)
+        assert bands.dtype == np.float64
+        assert bands.tolist() == [100.0, 125.0, 160.0, 200.0]
+        bands[0] = 0.0
+        assert utils.third_octave_bands(100, 200)[0] == 100.0
+
     def test_nrc_calculation(self):
         freqs = utils.frequency_axis(20, 20000, 12)
         # Perfect absorber: alpha=1 everywhere → NRC=1.0
@@ -56,6 +89,51 @@ class TestUtils:
         expected_keys = {"63", "125", "250", "500", "1000", "2000", "4000"}
         assert set(summary.keys()) == expected_keys
 
+    def test_saa_batch_matches_saa(self):
+        """Row-wise SAA should equal saa() on each row exactly."""
+        freqs = utils.frequency_axis(20, 20000, 12)
+        alpha = np.random.default_rng(1).uniform(-0.1, 1.1, (30, len(freqs)))
+        assert utils.saa_batch(alpha, freqs).tolist() == [utils.saa(a, freqs) for a in alpha]
+
+    def test_nrc_batch_matches_nrc(self):
+        """Row-wise NRC should equal nrc() on each row exactly."""
+        freqs = utils.frequency_axis(20, 20000, 12)
+        alpha = np.random.default_rng(2).uniform(-0.1, 1.1, (30, len(freqs)))
+        assert utils.nrc_batch(alpha, freqs).tolist() == [utils.nrc(a, freqs) for a in alpha]
+
+    def test_batch_metrics_clamp_on_narrow_axis(self):
+        """Targets beyond the axis take the end values, as in nrc() and saa()."""
+        freqs = utils.frequency_axis(400, 1500, 12)
+        alpha = np.random.default_rng(4).uniform(0.0, 1.0, (30, len(freqs)))
+        assert utils.nrc_batch(alpha, freqs).tolist() == [utils.nrc(a, freqs) for a in alpha]
+        assert utils.saa_batch(alpha, freqs).tolist() == [utils.saa(a, freqs) for a in alpha]
+
+    def test_batch_metrics_float32_match_scalar(self):
+        """float32 input should be evaluated in float64, like np.interp does."""
+        freqs = utils.frequency_axis(20, 20000, 12)
+        alpha = np.random.default_rng(3).uniform(0.0, 1.0, (50, len(freqs))).astype(np.float32)
+        assert utils.nrc_batch(alpha, freqs).tolist() == [utils.nrc(a, freqs) for a in alpha]
+        assert utils.saa_batch(alpha, freqs).tolist() == [utils.saa(a, freqs) for a in alpha]
+
+    def test_absorption_metrics_matches_individual(self):
+        """Fused metrics should equal nrc, saa and octave_band_summary."""
+        freqs = utils.frequency_axis(20, 20000, 12)
+        alpha = np.random.default_rng(0).uniform(-0.1, 1.1, len(freqs))
+        assert utils.absorption_metrics(alpha, freqs) == {
+            "nrc": utils.nrc(alpha, freqs),
+            "saa": utils.saa(alpha, freqs),
+            "octave_summary": utils.octave_band_summary(alpha, freqs),
+        }
+
+    def test_freq_cache_shared_across_models(self):
+        """Models given a shared FreqCache should match their standalone results."""
+        freqs = utils.frequency_axis(20, 20000, 12)
+        ctx = utils.FreqCache(freqs)
+        np.testing.assert_allclose(ctx.k0, 2 * np.pi * freqs / utils.C_0)
+        np.testing.assert_allclose(
+            air_gap_matrix(freqs, 0.05, ctx=ctx), air_gap_matrix(freqs, 0.05)
+        )
+
 
 class TestTMM:
     def test_air_layer_identity_at_zero_thickness(self):
@@ -79,11 +157,33 @@ class TestTMM:
         """Rigid wall (no absorber) should have zero absorption."""
         freqs = np.array([500.0, 1000.0])
         # Identity matrix = rigid wall directly
-        T = np.tile(np.eye(2, dtype=complex), (2, 1, 1))
+        T = np.broadcast_to(np.eye(2, dtype=complex), (len(freqs), 2, 2))
         Zs = tmm.surface_impedance(T)
         alpha = tmm.absorption_coefficient(Zs)
         np.testing.assert_allclose(alpha, 0.0, atol=1e-10)
 
+    def test_absorption_matches_reflection_form(self):
+        """Closed form should equal 1 - |R|^2 with R = (Zs - Z0)/(Zs + Z0)."""
+        rng = np.random.default_rng(0)
+        Zs = rng.uniform(-500, 3000, 50) + 1j * rng.uniform(-3000, 3000, 50)
+        R = (Zs - utils.Z_0) / (Zs + utils.Z_0)
+        expected = 1.0 - np.abs(R) ** 2
+        np.testing.assert_allclose(
+            tmm.absorption_coefficient(Zs, clip=False), expected, atol=1e-12
+        )
+        np.testing.assert_allclose(
+            tmm.absorption_coefficient(Zs), np.clip(expected, 0.0, 1.0), atol=1e-12
+        )
+
+    def test_absorption_accepts_scalars_and_lists(self):
+        """Scalar and list impedances give the same alpha as an array."""
+        Zs = np.array([300.0 + 1.0j, 500.0 - 200.0j, -300.0 + 1.0j])
+        expected = tmm.absorption_coefficient(Zs)
+        assert tmm.absorption_coefficient(Zs.tolist()).tolist() == expected.tolist()
+        for z, a in zip(Zs.tolist(), expected.tolist()):
+            assert float(tmm.absorption_coefficient(z)) == a
+        assert tmm.absorption_coefficient(300.0 + 1.0j) == pytest.approx(0.97489, abs=1e-5)
+
     def test_multiply_chain_single(self):
         """Chain of one matrix should equal that matrix."""
         freqs = np.array([500.0])
@@ -100,27 +200,111 @@ class TestTMM:
         T_chain = tmm.multiply_chain([T1, T2])
         np.testing.assert_allclose(T_chain, T_combined, atol=1e-10)
 
-    def test_absorption_bounded(self):
+    def test_surface_impedance_from_layers_matches_chain(self, freqs_default, miki_oc703):
+        """Back-to-front state propagation should equal Zs of the full product."""
+        freqs = freqs_default
+        Zc, kc = miki_oc703
+        layers = [
+            membrane_matrix(freqs, 2.5),
+            tmm.porous_layer_matrix(freqs, Zc, kc, 0.050),
+            air_gap_matrix(freqs, 0.100),
+        ]
+        Zs_chain = tmm.surface_impedance(tmm.multiply_chain(layers))
+        np.testing.assert_allclose(tmm.surface_impedance_from_layers(layers), Zs_chain, rtol=1e-12)
+
+    def test_batched_designs_match_individual(self):
+        """Array thicknesses/masses should evaluate one design per leading index."""
+        freqs = np.array([125.0, 500.0, 2000.0])
+        gaps = np.array([0.02, 0.05, 0.10])
+        masses = np.array([1.0, 2.5, 4.0])
+        T_air = air_gap_matrix(freqs, gaps)
+        T_mem = membrane_matrix(freqs, masses)
+        assert T_air.shape == (3, 3, 2, 2)
+
+        alpha = tmm.absorption_from_layers(freqs, [T_mem, T_air])
+        for i in range(len(gaps)):
+            expected = tmm.absorption_from_layers(
+                freqs, [membrane_matrix(freqs, masses[i]), air_gap_matrix(freqs, gaps[i])]
+            )
+            np.testing.assert_allclose(alpha[i], expected, atol=1e-12)
+
+    def test_cos_sin_matches_numpy(self):
+        """Real-arithmetic complex cos/sin should match np.cos/np.sin to rounding."""
+        rng = np.random.default_rng(0)
+        for scale in (1e-12, 1e-3, 1.0, 50.0, 500.0):
+            z = rng.uniform(-50, 50, 1000) + 1j * scale * rng.uniform(-1, 1, 1000)
+            cos_z, sin_z = tmm.cos_sin(z)
+            np.testing.assert_allclose(cos_z, np.cos(z), rtol=1e-14)
+            np.testing.assert_allclose(sin_z, np.sin(z), rtol=1e-14)
+
+    def test_absorption_bounded(self, freqs_default, miki_oc703):
         """Absorption coefficient should always be in [0, 1]."""
-        freqs = utils.frequency_axis(20, 20000, 12)
-        from acoustic.models.porous import miki
-        Zc, kc = miki(freqs, 13000)
+        freqs = freqs_default
+        Zc, kc = miki_oc703
         matrices = [tmm.porous_layer_matrix(freqs, Zc, kc, 0.050)]
         alpha = tmm.absorption_from_layers(freqs, matrices)
         assert np.all(alpha >= 0.0)
         assert np.all(alpha <= 1.0)
 
 
+class TestDiffuse:
+    def test_matches_per_angle_quadrature(self, freqs_default, miki_oc703):
+        """Vectorized integration should match an explicit loop over quadrature angles."""
+        freqs = freqs_default
+        Zc, kc = miki_oc703
+        Zs = tmm.surface_impedance(
+            tmm.multiply_chain([tmm.porous_layer_matrix(freqs, Zc, kc, 0.050)])
+        )
+
+        theta_max = np.radians(78.0)
+        nodes, weights = np.polynomial.legendre.leggauss(10)
+        expected = np.zeros(len(freqs))
+        for x, wt in zip(nodes, weights):
+            theta = 0.5 * theta_max * (x + 1.0)
+            R = (Zs * np.cos(theta) - utils.Z_0) / (Zs * np.cos(theta) + utils.Z_0)
+            alpha = np.clip(1.0 - np.abs(R) ** 2, 0.0, 1.0)
+            expected += 0.5 * theta_max * wt * alpha * np.sin(theta) * np.cos(theta)
+        expected = np.clip(2.0 * expected, 0.0, 1.0)
+
+        alpha_diff = diffuse_field_alpha_from_impedance(Zs)
+        np.testing.assert_allclose(alpha_diff, expected, atol=1e-12)
+
+    def test_float32_close_to_float64(self, freqs_default, miki_oc703):
+        """Single-precision integration should agree with double to ~1e-5."""
+        freqs = freqs_default
+        Zc, kc = miki_oc703
+        Zs = tmm.surface_impedance(
+            tmm.multiply_chain([tmm.porous_layer_matrix(freqs, Zc, kc, 0.050)])
+        )
+        alpha_32 = diffuse_field_alpha_from_impedance(Zs, dtype=np.float32)
+        assert alpha_32.dtype == np.float32
+        np.testing.assert_allclose(alpha_32, diffuse_field_alpha_from_impedance(Zs), atol=1e-5)
+
+    def test_batched_impedances(self):
+        """A (M, N) stack of impedances should integrate row by row."""
+        Zs = np.array([[400.0 - 300.0j, 1200.0 + 50.0j], [900.0 - 10.0j, 2000.0 - 800.0j]])
+        alpha = diffuse_field_alpha_from_impedance(Zs)
+        assert alpha.shape == (2, 2)
+        for i in range(2):
+            np.testing.assert_allclose(alpha[i], diffuse_field_alpha_from_impedance(Zs[i]))
+
+    def test_rigid_wall_no_absorption(self):
+        """Very large surface impedance should give zero diffuse absorption."""
+        Zs = np.full(3, 1e30 + 0j)
+        np.testing.assert_allclose(diffuse_field_alpha_from_impedance(Zs), 0.0, atol=1e-10)
+        np.testing.assert_allclose(
+            diffuse_field_alpha_from_impedance(Zs, dtype=np.float32), 0.0, atol=1e-10
+        )
+
+
 class TestPorousAbsorber:
     """Integration tests for porous absorber through full TMM pipeline."""
 
-    def test_thicker_absorbs_more(self):
+    def test_thicker_absorbs_more(self, freqs_default, miki_oc703):
         """Thicker porous layer should absorb more at mid frequencies."""
-        freqs = utils.frequency_axis(20, 20000, 12)
-        from acoustic.models.porous import miki
-
+        freqs = freqs_default
         # 25mm vs 100mm
-        Zc, kc = miki(freqs, 13000)
+        Zc, kc = miki_oc703
         alpha_25 = tmm.absorption_from_layers(
             freqs, [tmm.porous_layer_matrix(freqs, Zc, kc, 0.025)]
         )
@@ -130,12 +314,10 @@ class TestPorousAbsorber:
         # NRC of 100mm should be higher than 25mm
         assert utils.nrc(alpha_100, freqs) > utils.nrc(alpha_25, freqs)
 
-    def test_air_gap_improves_low_freq(self):
+    def test_air_gap_improves_low_freq(self, freqs_default, miki_oc703):
         """Adding air gap should improve low-frequency absorption."""
-        freqs = utils.frequency_axis(20, 20000, 12)
-        from acoustic.models.porous import miki
-
-        Zc, kc = miki(freqs, 13000)
+        freqs = freqs_default
+        Zc, kc = miki_oc703
 
         # Without air gap
         alpha_no_gap = tmm.absorption_from_layers(
@@ -151,27 +333,45 @@ class TestPorousAbsorber:
         )
 
         # Alpha at 250 Hz should be better with air gap
-        idx_250 = np.argmin(np.abs(freqs - 250))
+        idx_250 = utils.nearest_index(freqs, 250)
         assert alpha_with_gap[idx_250] > alpha_no_gap[idx_250]
 
-    def test_oc703_50mm_reasonable(self):
+    def test_oc703_50mm_reasonable(self, freqs_default, miki_oc703):
         """OC703 50mm absorption should be physically reasonable."""
-        freqs = utils.frequency_axis(20, 20000, 12)
-        from acoustic.models.porous import miki
-
-        Zc, kc = miki(freqs, 13000)
+        freqs = freqs_default
+        Zc, kc = miki_oc703
         alpha = tmm.absorption_from_layers(
             freqs, [tmm.porous_layer_matrix(freqs, Zc, kc, 0.050)]
         )
 
         # At 500 Hz: expect 0.4-0.8 (normal incidence)
-        idx_500 = np.argmin(np.abs(freqs - 500))
+        idx_500 = utils.nearest_index(freqs, 500)
         assert 0.3 <= alpha[idx_500] <= 0.9
 
         # At 2000 Hz: expect > 0.9
-        idx_2k = np.argmin(np.abs(freqs - 2000))
+        idx_2k = utils.nearest_index(freqs, 2000)
         assert alpha[idx_2k] > 0.85
 
         # NRC should be reasonable (0.5-0.9)
         nrc = utils.nrc(alpha, freqs)
         assert 0.4 <= nrc <= 1.0
+
+    def test_optimizer_fast_path_matches_layer_chain(self, freqs_default, miki_oc703):
+        """Optimizer's closed-form porous + air gap alpha equals the TMM chain."""
+        freqs = freqs_default
+        from acoustic.optimizer import _evaluate_design_precomputed
+
+        Zc, kc = miki_oc703
+        thickness = np.array([0.025, 0.050, 0.100])
+        gap = np.array([0.0, 0.040, 0.100])
+        fast = _evaluate_design_precomputed(freqs, Zc, kc, thickness, gap)
+
+        for i in range(len(thickness)):
+            alpha = tmm.absorption_from_layers(
+                freqs,
+                [
+                    tmm.porous_layer_matrix(freqs, Zc, kc, thickness[i]),
+                    air_gap_matrix(freqs, gap[i]),
+                ],
+            )
+            np.testing.assert_allclose(fast[i], alpha, atol=1e-12)
@@ -23,17 +23,58 @@ from acoustic.models.helmholtz import helmholtz_impedance, helmholtz_resonance
 from acoustic.models.membrane import panel_absorber_resonance
 from acoustic.models.perforated import mpp_maa, perforated_ingard
 from acoustic.models.porous import allard_champoux, delany_bazley, jca, miki
+from acoustic.optimizer import room_mode_array, room_mode_frequencies
 
 
-def alpha_at_freq(alpha: np.ndarray, freqs: np.ndarray, target_hz: float) -> float:
-    """Interpolate alpha at target frequency using log-frequency interpolation."""
-    return float(np.interp(np.log10(target_hz), np.log10(freqs), alpha))
+# Typical OC703 flow resistivity (N·s/m⁴), shared by the porous checks
+SIGMA_OC703 = 13000
+
+# Single high-frequency point for the convergence checks
+FREQS_20K = np.array([20000.0])
+FREQS_20K.flags.writeable = False
+
+
+def alpha_at_freq(alpha: np.ndarray, log_freqs: np.ndarray, target_hz: float) -> float:
+    """Interpolate alpha at target frequency on a log10 frequency axis (see log_freqs)."""
+    return float(np.interp(np.log10(target_hz), log_freqs, alpha))
+
+
+def alphas_at_freqs(alpha: np.ndarray, log_freqs: np.ndarray, targets_hz) -> np.ndarray:
+    """alpha_at_freq for several target frequencies in one interpolation."""
+    return np.interp(np.log10(np.asarray(targets_hz, dtype=float)), log_freqs, alpha)
+
+
+def sheet_alpha(freqs: np.ndarray, T_panel: np.ndarray, cavity_depth_m) -> np.ndarray:
+    """Absorption of a panel sheet matrix over an air cavity via TMM.
+
+    An array of cavity depths gives one absorption row per depth.
+    """
+    T_air = air_gap_matrix(freqs, cavity_depth_m)
+    return tmm.absorption_from_layers(freqs, [T_panel, T_air])
 
 
 @pytest.fixture
-def freqs():
+def freqs(freqs_default):
     """Standard frequency axis at third-octave resolution."""
-    return utils.frequency_axis(20, 20000, 12)
+    return freqs_default
+
+
+@pytest.fixture(scope="module")
+def log_freqs(freqs_default):
+    """log10 of the standard axis, for alpha_at_freq, read-only."""
+    log_freqs = np.log10(freqs_default)
+    log_freqs.flags.writeable = False
+    return log_freqs
+
+
+@pytest.fixture(scope="module")
+def oc703_50mm(freqs_default, miki_oc703):
+    """OC703 50mm normal-incidence absorption via Miki model, read-only."""
+    Zc, kc = miki_oc703
+    T = tmm.porous_layer_matrix(freqs_default, Zc, kc, 0.050)
+    alpha = tmm.absorption_from_layers(freqs_default, [T])
+    alpha.flags.writeable = False
+    return alpha
 
 
 # ---------------------------------------------------------------------------
@@ -44,34 +85,26 @@ def freqs():
 class TestPorousModelCoefficients:
     """Verify porous models reproduce their published formula coefficients."""
 
-    def test_miki_zc_at_x01(self):
-        """Miki Zc at X=0.1 — hand-calculated from Miki (1990) coefficients.
+    # Evaluation point X = rho_0 * f / sigma = 0.1 for OC703
+    F_X01 = 0.1 * SIGMA_OC703 / utils.RHO_0
+
+    def test_miki_coefficients_at_x01(self):
+        """Miki Zc and kc at X=0.1 — hand-calculated from Miki (1990) coefficients.
 
         X^(-0.632) = 10^0.632 ≈ 4.2856
         Zc = Z_0 * (1 + 0.070*4.2856 - j*0.107*4.2856)
            = Z_0 * (1.300 - 0.4586j)
-        """
-        sigma = 13000
-        f = 0.1 * sigma / utils.RHO_0  # X = 0.1
-        freqs = np.array([f])
-        Zc, _ = miki(freqs, sigma)
-
-        assert Zc[0].real == pytest.approx(utils.Z_0 * 1.300, abs=1.0)
-        assert Zc[0].imag == pytest.approx(-utils.Z_0 * 0.4586, abs=1.0)
-
-    def test_miki_kc_at_x01(self):
-        """Miki kc at X=0.1 — hand-calculated from Miki (1990) coefficients.
 
         X^(-0.618) = 10^0.618 ≈ 4.1498
         kc = k0 * (1 + 0.109*4.1498 - j*0.160*4.1498)
            = k0 * (1.4523 - 0.6640j)
         """
-        sigma = 13000
-        f = 0.1 * sigma / utils.RHO_0
-        freqs = np.array([f])
-        _, kc = miki(freqs, sigma)
+        Zc, kc = miki(np.array([self.F_X01]), SIGMA_OC703)
 
-        k0 = 2 * np.pi * f / utils.C_0
+        assert Zc[0].real == pytest.approx(utils.Z_0 * 1.300, abs=1.0)
+        assert Zc[0].imag == pytest.approx(-utils.Z_0 * 0.4586, abs=1.0)
+
+        k0 = 2 * np.pi * self.F_X01 / utils.C_0
         assert kc[0].real == pytest.approx(k0 * 1.4523, abs=0.01)
         assert kc[0].imag == pytest.approx(-k0 * 0.6640, abs=0.01)
 
@@ -82,10 +115,7 @@ class TestPorousModelCoefficients:
         Zc = Z_0 * (1 + 0.0571*5.675 - j*0.0870*5.393)
            = Z_0 * (1.324 - 0.4692j)
         """
-        sigma = 13000
-        f = 0.1 * sigma / utils.RHO_0
-        freqs = np.array([f])
-        Zc, _ = delany_bazley(freqs, sigma)
+        Zc, _ = delany_bazley(np.array([self.F_X01]), SIGMA_OC703)
 
         assert Zc[0].real == pytest.approx(utils.Z_0 * 1.324, abs=1.0)
         assert Zc[0].imag == pytest.approx(-utils.Z_0 * 0.4692, abs=1.0)
@@ -97,13 +127,14 @@ class TestPorousModelCoefficients:
         recover rho_eff and K_eff and verify they converge to rho_0 and gamma*P0.
         """
         freqs = np.array([500.0, 1000.0, 5000.0, 20000.0])
-        sigma = 13000
-        Zc, kc = allard_champoux(freqs, sigma)
+        Zc, kc = allard_champoux(freqs, SIGMA_OC703)
         omega = 2 * np.pi * freqs
 
-        # Recover effective density and bulk modulus
-        rho_eff = Zc * kc / omega
-        K_eff = Zc * omega / kc
+        # Recover effective density and bulk modulus; both share omega/kc
+        # (the complex phase speed)
+        c_eff = omega / kc
+        rho_eff = Zc / c_eff
+        K_eff = Zc * c_eff
 
         # Physical: positive real parts at all frequencies
         assert np.all(rho_eff.real > 0)
@@ -126,31 +157,22 @@ class TestPorousAbsorptionValidation:
     Ref: CLAUDE.md ("alpha ≈ 0.50 at 500 Hz ... consistent with impedance tube data")
     """
 
-    @pytest.fixture
-    def oc703_50mm(self, freqs):
-        """OC703 50mm normal-incidence absorption via Miki model."""
-        Zc, kc = miki(freqs, 13000)
-        T = tmm.porous_layer_matrix(freqs, Zc, kc, 0.050)
-        return tmm.absorption_from_layers(freqs, [T])
-
-    def test_alpha_250hz(self, freqs, oc703_50mm):
-        """OC703 50mm at 250 Hz: ~0.20 (low-frequency, thin absorber)."""
-        alpha = alpha_at_freq(oc703_50mm, freqs, 250)
-        assert alpha == pytest.approx(0.20, abs=0.05)
-
-    def test_alpha_500hz(self, freqs, oc703_50mm):
-        """OC703 50mm at 500 Hz: ~0.50 (CLAUDE.md reference point)."""
-        alpha = alpha_at_freq(oc703_50mm, freqs, 500)
-        assert alpha == pytest.approx(0.50, abs=0.05)
-
-    def test_alpha_1000hz(self, freqs, oc703_50mm):
-        """OC703 50mm at 1000 Hz: ~0.90."""
-        alpha = alpha_at_freq(oc703_50mm, freqs, 1000)
-        assert alpha == pytest.approx(0.90, abs=0.05)
-
-    def test_alpha_2000hz(self, freqs, oc703_50mm):
+    @pytest.mark.parametrize(
+        "f_hz, expected",
+        [
+            (250, 0.20),  # low-frequency, thin absorber
+            (500, 0.50),  # CLAUDE.md reference point
+            (1000, 0.90),
+        ],
+    )
+    def test_alpha_curve(self, log_freqs, oc703_50mm, f_hz, expected):
+        """OC703 50mm at 250/500/1000 Hz: ~0.20/0.50/0.90, within 0.05."""
+        alpha = alpha_at_freq(oc703_50mm, log_freqs, f_hz)
+        assert alpha == pytest.approx(expected, abs=0.05)
+
+    def test_alpha_2000hz(self, log_freqs, oc703_50mm):
         """OC703 50mm at 2000 Hz: >0.95 (well above quarter-wavelength)."""
-        alpha = alpha_at_freq(oc703_50mm, freqs, 2000)
+        alpha = alpha_at_freq(oc703_50mm, log_freqs, 2000)
         assert alpha > 0.95
 
     def test_nrc(self, freqs, oc703_50mm):
@@ -158,24 +180,20 @@ class TestPorousAbsorptionValidation:
         nrc = utils.nrc(oc703_50mm, freqs)
         assert nrc == pytest.approx(0.65, abs=0.05)
 
-    def test_100mm_nrc(self, freqs):
+    def test_100mm_nrc(self, freqs, miki_oc703):
         """OC703 100mm NRC: ~0.85 (doubled thickness)."""
-        Zc, kc = miki(freqs, 13000)
+        Zc, kc = miki_oc703
         alpha = tmm.absorption_from_layers(
             freqs, [tmm.porous_layer_matrix(freqs, Zc, kc, 0.100)]
         )
         nrc = utils.nrc(alpha, freqs)
         assert nrc == pytest.approx(0.85, abs=0.10)
 
-    def test_quarter_wavelength_peak(self, freqs):
+    def test_quarter_wavelength_peak(self, log_freqs, oc703_50mm):
         """At quarter-wavelength frequency (c/4d ≈ 1715 Hz), alpha approaches 1.0."""
         d = 0.050  # 50mm
         f_qw = utils.C_0 / (4 * d)  # ~1715 Hz
-        Zc, kc = miki(freqs, 13000)
-        alpha = tmm.absorption_from_layers(
-            freqs, [tmm.porous_layer_matrix(freqs, Zc, kc, d)]
-        )
-        alpha_qw = alpha_at_freq(alpha, freqs, f_qw)
+        alpha_qw = alpha_at_freq(oc703_50mm, log_freqs, f_qw)
         assert alpha_qw > 0.95
 
 
@@ -187,54 +205,42 @@ class TestPorousAbsorptionValidation:
 class TestCrossModelAgreement:
     """D-B, Miki, and A-C models should agree for standard materials."""
 
-    def test_db_vs_miki_nrc_frequencies(self, freqs):
+    def test_db_vs_miki_nrc_frequencies(self, freqs, oc703_50mm, log_freqs):
         """D-B vs Miki: alpha difference < 0.05 at NRC frequencies for OC703 50mm."""
-        sigma = 13000
         d = 0.050
 
-        Zc_db, kc_db = delany_bazley(freqs, sigma)
+        Zc_db, kc_db = delany_bazley(freqs, SIGMA_OC703)
         alpha_db = tmm.absorption_from_layers(
             freqs, [tmm.porous_layer_matrix(freqs, Zc_db, kc_db, d)]
         )
 
-        Zc_m, kc_m = miki(freqs, sigma)
-        alpha_m = tmm.absorption_from_layers(
-            freqs, [tmm.porous_layer_matrix(freqs, Zc_m, kc_m, d)]
+        targets = [250, 500, 1000, 2000]
+        a_db = alphas_at_freqs(alpha_db, log_freqs, targets)
+        a_m = alphas_at_freqs(oc703_50mm, log_freqs, targets)
+        np.testing.assert_allclose(
+            a_db, a_m, rtol=0, atol=0.05, err_msg=f"D-B vs Miki at {targets} Hz"
         )
 
-        for f_target in [250, 500, 1000, 2000]:
-            a_db = alpha_at_freq(alpha_db, freqs, f_target)
-            a_m = alpha_at_freq(alpha_m, freqs, f_target)
-            assert abs(a_db - a_m) < 0.05, (
-                f"D-B vs Miki differ by {abs(a_db - a_m):.3f} at {f_target} Hz"
-            )
-
-    def test_high_frequency_convergence(self):
+    @pytest.mark.parametrize(
+        "model_fn", [delany_bazley, miki, allard_champoux], ids=["db", "miki", "ac"]
+    )
+    def test_high_frequency_convergence(self, model_fn):
         """All 3 models: |Zc|/Z_0 converges toward 1.0 at 20 kHz."""
-        freqs = np.array([20000.0])
-        sigma = 13000
-
-        for model_fn in [delany_bazley, miki, allard_champoux]:
-            Zc, _ = model_fn(freqs, sigma)
-            ratio = abs(Zc[0]) / utils.Z_0
-            assert 0.95 < ratio < 1.10, (
-                f"{model_fn.__name__}: |Zc|/Z_0 = {ratio:.3f} at 20 kHz"
-            )
+        Zc, _ = model_fn(FREQS_20K, SIGMA_OC703)
+        ratio = abs(Zc[0]) / utils.Z_0
+        assert 0.95 < ratio < 1.10, (
+            f"{model_fn.__name__}: |Zc|/Z_0 = {ratio:.3f} at 20 kHz"
+        )
 
-    def test_jca_vs_miki_nrc(self, freqs):
+    def test_jca_vs_miki_nrc(self, freqs, oc703_50mm):
         """JCA with typical OC703 microstructure: NRC within 0.10 of Miki."""
-        sigma = 13000
         d = 0.050
 
-        Zc_m, kc_m = miki(freqs, sigma)
-        alpha_m = tmm.absorption_from_layers(
-            freqs, [tmm.porous_layer_matrix(freqs, Zc_m, kc_m, d)]
-        )
-        nrc_m = utils.nrc(alpha_m, freqs)
+        nrc_m = utils.nrc(oc703_50mm, freqs)
 
         # JCA with typical OC703 microstructure parameters
         Zc_j, kc_j = jca(
-            freqs, sigma,
+            freqs, SIGMA_OC703,
             porosity=0.97,
             tortuosity=1.06,
             viscous_length=120e-6,
@@ -321,16 +327,14 @@ class TestHelmholtzValidation:
         V = 50e-6
         f0 = helmholtz_resonance(L, r, V)
 
-        freqs = np.linspace(f0 * 0.5, f0 * 1.5, 10000)
+        # Two points just either side of f0 (±0.1%)
+        freqs = np.array([f0 * 0.999, f0 * 1.001])
         Z = helmholtz_impedance(freqs, L, r, V, viscous_loss=False)
         im_Z = Z.imag
 
         # Below resonance: stiffness dominates -> Im(Z) < 0
         # Above resonance: mass dominates -> Im(Z) > 0
-        idx = np.argmin(np.abs(freqs - f0))
-        assert im_Z[max(0, idx - 10)] * im_Z[min(len(im_Z) - 1, idx + 10)] < 0, (
-            "Im(Z) should change sign at resonance"
-        )
+        assert im_Z[0] < 0 < im_Z[1], "Im(Z) should change sign at resonance"
 
 
 # ---------------------------------------------------------------------------
@@ -346,20 +350,19 @@ class TestPanelAbsorberValidation:
     Ref: Kuttruff (2009) Ch. 6.4.
     """
 
-    def test_3mm_plywood_100mm(self):
-        """3mm plywood (1.5 kg/m^2) + 100mm cavity -> ~155 Hz."""
-        f0 = panel_absorber_resonance(1.5, 0.100)
-        assert f0 == pytest.approx(155, abs=5)
-
-    def test_6mm_mdf_50mm(self):
-        """6mm MDF (4.5 kg/m^2) + 50mm cavity -> ~126 Hz."""
-        f0 = panel_absorber_resonance(4.5, 0.050)
-        assert f0 == pytest.approx(126, abs=5)
-
-    def test_12mm_plywood_200mm(self):
-        """12mm plywood (7.2 kg/m^2) + 200mm cavity -> ~50 Hz."""
-        f0 = panel_absorber_resonance(7.2, 0.200)
-        assert f0 == pytest.approx(50, abs=3)
+    @pytest.mark.parametrize(
+        "m, d, expected, tol",
+        [
+            (1.5, 0.100, 155, 5),  # 3mm plywood + 100mm cavity
+            (4.5, 0.050, 126, 5),  # 6mm MDF + 50mm cavity
+            (7.2, 0.200, 50, 3),  # 12mm plywood + 200mm cavity
+        ],
+        ids=["3mm_plywood_100mm", "6mm_mdf_50mm", "12mm_plywood_200mm"],
+    )
+    def test_panel_resonance(self, m, d, expected, tol):
+        """Panel (m kg/m^2) + cavity d -> expected resonance within tol Hz."""
+        f0 = panel_absorber_resonance(m, d)
+        assert f0 == pytest.approx(expected, abs=tol)
 
     def test_approximation_60_over_sqrt_md(self):
         """Exact formula matches classic 60/sqrt(md) approximation within 1%.
@@ -367,14 +370,14 @@ class TestPanelAbsorberValidation:
         The approximation 60/sqrt(m*d) (m in kg/m^2, d in m) is derived from
         f_0 = (c_0/2pi)*sqrt(rho_0/md) using standard air properties.
         """
-        test_cases = [(1.5, 0.100), (4.5, 0.050), (7.2, 0.200), (2.0, 0.075)]
+        m = np.array([1.5, 4.5, 7.2, 2.0])
+        d = np.array([0.100, 0.050, 0.200, 0.075])
 
-        for m, d in test_cases:
-            f0_exact = panel_absorber_resonance(m, d)
-            f0_approx = 60.0 / np.sqrt(m * d)
-            assert f0_exact == pytest.approx(f0_approx, rel=0.01), (
-                f"m={m}, d={d}: exact={f0_exact:.1f} Hz, approx={f0_approx:.1f} Hz"
-            )
+        f0_exact = panel_absorber_resonance(m, d)
+        f0_approx = 60.0 / np.sqrt(m * d)
+        np.testing.assert_allclose(
+            f0_exact, f0_approx, rtol=0.01, err_msg=f"m={m.tolist()}, d={d.tolist()}"
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -382,6 +385,20 @@ class TestPanelAbsorberValidation:
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="module")
+def room_modes():
+    """Factory: room modes for (lx, ly, lz) keyed by (m, n, p), built once per room."""
+    cache = {}
+
+    def get(lx, ly, lz):
+        key = (lx, ly, lz)
+        if key not in cache:
+            cache[key] = {m["mode"]: m for m in room_mode_frequencies(lx, ly, lz)}
+        return cache[key]
+
+    return get
+
+
 class TestRoomModesValidation:
     """Analytical room mode frequencies for standard room dimensions.
 
@@ -391,47 +408,39 @@ class TestRoomModesValidation:
     """
 
     @pytest.fixture
-    def modes_5x4x3(self):
-        """Room modes for a 5m x 4m x 3m room."""
-        from acoustic.optimizer import room_mode_frequencies
-
-        return room_mode_frequencies(5.0, 4.0, 3.0)
-
-    def _find_mode(self, modes, mode_tuple):
-        for m in modes:
-            if m["mode"] == mode_tuple:
-                return m
-        raise ValueError(f"Mode {mode_tuple} not found")
+    def modes_5x4x3(self, room_modes):
+        """Room modes for a 5m x 4m x 3m room, keyed by (m, n, p) in result order."""
+        return room_modes(5.0, 4.0, 3.0)
 
     def test_axial_modes(self, modes_5x4x3):
         """Axial modes: (1,0,0)=34.3, (0,1,0)=42.9, (0,0,1)=57.2 Hz."""
-        m100 = self._find_mode(modes_5x4x3, (1, 0, 0))
+        m100 = modes_5x4x3[(1, 0, 0)]
         assert m100["frequency_hz"] == pytest.approx(34.3, abs=0.1)
         assert m100["type"] == "axial"
 
-        m010 = self._find_mode(modes_5x4x3, (0, 1, 0))
+        m010 = modes_5x4x3[(0, 1, 0)]
         assert m010["frequency_hz"] == pytest.approx(42.9, abs=0.1)
         assert m010["type"] == "axial"
 
-        m001 = self._find_mode(modes_5x4x3, (0, 0, 1))
+        m001 = modes_5x4x3[(0, 0, 1)]
         assert m001["frequency_hz"] == pytest.approx(57.2, abs=0.1)
         assert m001["type"] == "axial"
 
     def test_tangential_mode(self, modes_5x4x3):
         """Tangential mode (1,1,0) = 54.9 Hz."""
-        m110 = self._find_mode(modes_5x4x3, (1, 1, 0))
+        m110 = modes_5x4x3[(1, 1, 0)]
         assert m110["frequency_hz"] == pytest.approx(54.9, abs=0.1)
         assert m110["type"] == "tangential"
 
     def test_oblique_mode(self, modes_5x4x3):
         """Oblique mode (1,1,1) = 79.3 Hz."""
-        m111 = self._find_mode(modes_5x4x3, (1, 1, 1))
+        m111 = modes_5x4x3[(1, 1, 1)]
         assert m111["frequency_hz"] == pytest.approx(79.3, abs=0.1)
         assert m111["type"] == "oblique"
 
     def test_mode_classification(self, modes_5x4x3):
         """Verify mode type classification is consistent with index counts."""
-        for m in modes_5x4x3:
+        for m in modes_5x4x3.values():
             nx, ny, nz = m["mode"]
             nonzero = sum(1 for x in (nx, ny, nz) if x > 0)
             if nonzero == 1:
@@ -441,27 +450,56 @@ class TestRoomModesValidation:
             else:
                 assert m["type"] == "oblique"
 
-    def test_cube_degenerate_modes(self):
+    def test_cube_degenerate_modes(self, room_modes):
         """Cube 4x4x4m: three degenerate first axial modes at 42.9 Hz."""
-        from acoustic.optimizer import room_mode_frequencies
-
-        modes = room_mode_frequencies(4.0, 4.0, 4.0)
+        modes = room_modes(4.0, 4.0, 4.0)
 
-        m100 = self._find_mode(modes, (1, 0, 0))
-        m010 = self._find_mode(modes, (0, 1, 0))
-        m001 = self._find_mode(modes, (0, 0, 1))
+        m100 = modes[(1, 0, 0)]
+        m010 = modes[(0, 1, 0)]
+        m001 = modes[(0, 0, 1)]
 
         expected = 343.0 / (2 * 4.0)  # = 42.875 Hz
         assert m100["frequency_hz"] == pytest.approx(expected, abs=0.1)
         assert m010["frequency_hz"] == pytest.approx(expected, abs=0.1)
         assert m001["frequency_hz"] == pytest.approx(expected, abs=0.1)
 
+    def test_structured_array_matches_dicts(self, modes_5x4x3):
+        """room_mode_array holds the same modes, in the same order, as the dict list."""
+        modes = room_mode_array(5.0, 4.0, 3.0)
+        assert len(modes) == len(modes_5x4x3)
+        for rec, m in zip(modes, modes_5x4x3.values()):
+            assert rec["frequency_hz"] == m["frequency_hz"]
+            assert (rec["m"], rec["n"], rec["p"]) == m["mode"]
+            assert rec["type"] == m["type"]
+
 
 # ---------------------------------------------------------------------------
 # 7. Perforated panel validation
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="module")
+def mpp_panel(freqs_default):
+    """Sheet matrix of the reference MPP (0.5mm holes, 1mm panel, 1% open), read-only."""
+    Z = mpp_maa(
+        freqs_default,
+        panel_thickness_m=0.001,
+        hole_diameter_m=0.0005,
+        porosity=0.01,
+    )
+    T_panel = tmm.impedance_sheet_matrix(freqs_default, Z)
+    T_panel.flags.writeable = False
+    return T_panel
+
+
+@pytest.fixture(scope="module")
+def mpp_50mm(freqs_default, mpp_panel):
+    """Reference MPP over a 50mm cavity, read-only."""
+    alpha = sheet_alpha(freqs_default, mpp_panel, 0.050)
+    alpha.flags.writeable = False
+    return alpha
+
+
 class TestPerforatedPanelValidation:
     """Physical behavior checks for perforated and micro-perforated panels.
 
@@ -472,28 +510,15 @@ class TestPerforatedPanelValidation:
         """Compute absorption for a perforated panel + air cavity via TMM."""
         Z = panel_impedance_fn(freqs, **kwargs)
         T_panel = tmm.impedance_sheet_matrix(freqs, Z)
-        T_air = air_gap_matrix(freqs, cavity_depth_m)
-        return tmm.absorption_from_layers(freqs, [T_panel, T_air])
+        return sheet_alpha(freqs, T_panel, cavity_depth_m)
 
-    def test_mpp_peak_absorption(self, freqs):
+    def test_mpp_peak_absorption(self, mpp_50mm):
         """MPP (0.5mm holes, 1mm panel, 50mm cavity): peak alpha > 0.90."""
-        alpha = self._perforated_alpha(
-            freqs, mpp_maa, 0.050,
-            panel_thickness_m=0.001,
-            hole_diameter_m=0.0005,
-            porosity=0.01,
-        )
-        assert np.max(alpha) > 0.90
+        assert np.max(mpp_50mm) > 0.90
 
-    def test_mpp_peak_frequency_range(self, freqs):
+    def test_mpp_peak_frequency_range(self, freqs, mpp_50mm):
         """MPP (0.5mm holes, 1mm panel, 50mm cavity): peak in 200-700 Hz."""
-        alpha = self._perforated_alpha(
-            freqs, mpp_maa, 0.050,
-            panel_thickness_m=0.001,
-            hole_diameter_m=0.0005,
-            porosity=0.01,
-        )
-        peak_freq = freqs[np.argmax(alpha)]
+        peak_freq = freqs[np.argmax(mpp_50mm)]
         assert 200 < peak_freq < 700
 
     def test_macro_perforated_peak_range(self, freqs):
@@ -507,36 +532,20 @@ class TestPerforatedPanelValidation:
         peak_freq = freqs[np.argmax(alpha)]
         assert 200 < peak_freq < 500
 
-    def test_deeper_cavity_shifts_peak_lower(self, freqs):
+    def test_deeper_cavity_shifts_peak_lower(self, freqs, mpp_panel):
         """Deeper cavity should shift MPP absorption peak to lower frequency."""
-        alpha_shallow = self._perforated_alpha(
-            freqs, mpp_maa, 0.025,
-            panel_thickness_m=0.001,
-            hole_diameter_m=0.0005,
-            porosity=0.01,
-        )
-        alpha_deep = self._perforated_alpha(
-            freqs, mpp_maa, 0.100,
-            panel_thickness_m=0.001,
-            hole_diameter_m=0.0005,
-            porosity=0.01,
-        )
-        peak_shallow = freqs[np.argmax(alpha_shallow)]
-        peak_deep = freqs[np.argmax(alpha_deep)]
+        # Both depths in one batched TMM pass: rows are (25mm, 100mm)
+        alpha = sheet_alpha(freqs, mpp_panel, np.array([0.025, 0.100]))
+        peak_shallow, peak_deep = freqs[np.argmax(alpha, axis=-1)]
         assert peak_deep < peak_shallow
 
-    def test_mpp_broader_than_macro_perforated(self, freqs):
+    def test_mpp_broader_than_macro_perforated(self, freqs, mpp_50mm):
         """MPP should have broader absorption bandwidth than macro-perforated panel.
 
         Micro-perforations provide higher viscous resistance, giving wider
         absorption bandwidth compared to macro holes.
         """
-        alpha_mpp = self._perforated_alpha(
-            freqs, mpp_maa, 0.050,
-            panel_thickness_m=0.001,
-            hole_diameter_m=0.0005,
-            porosity=0.01,
-        )
+        alpha_mpp = mpp_50mm
         alpha_macro = self._perforated_alpha(
             freqs, perforated_ingard, 0.050,
             panel_thickness_m=0.006,
@@ -545,8 +554,8 @@ class TestPerforatedPanelValidation:
         )
 
         # Count frequency bins where alpha > 0.5
-        bw_mpp = np.sum(alpha_mpp > 0.5)
-        bw_macro = np.sum(alpha_macro > 0.5)
+        bw_mpp = np.count_nonzero(alpha_mpp > 0.5)
+        bw_macro = np.count_nonzero(alpha_macro > 0.5)
         assert bw_mpp > bw_macro, (
             f"MPP bandwidth ({bw_mpp} bins > 0.5) should exceed "
             f"macro-perforated ({bw_macro} bins > 0.5)"